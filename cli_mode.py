@@ -3,16 +3,19 @@
 CyberChecker CLI Mode
 This script provides a command-line interface to use the CyberChecker functionality
 without requiring a GUI.
+
+On a free-threaded build (e.g. `python3.13t cli_mode.py check ...`) worker threads
+run in parallel and the default thread count is scaled up accordingly.
 """
 
 import os
 import sys
-import re
 import time
 import threading
-import json
-import queue
+import mmap
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
 
 # Do not load Kivy in CLI mode - Create direct imports of the utility modules
@@ -20,7 +23,39 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import our utility modules directly (without depending on utils/__init__.py which might import Kivy)
 from utils.config_manager import ConfigManager
-from utils.http_client import HttpClient
+from utils.http_client import HttpClient, HttpClientPool, CompiledConfig
+
+# Workers spend nearly all their time blocked on network I/O, so a small
+# stack lets many more of them run without reserving 8MB each
+WORKER_STACK_SIZE = 512 * 1024
+
+# Free-threaded builds (3.13t+) run worker threads truly in parallel
+GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+# Default worker thread count; scaled with the CPU count when there is no GIL
+DEFAULT_THREADS = 10 if GIL_ENABLED else min(512, (os.cpu_count() or 1) * 32)
+
+# Combos submitted ahead per worker thread, bounding memory held by futures
+MAX_PENDING_PER_THREAD = 4
+
+# Combos a worker counts locally before merging into the shared stats
+STATS_FLUSH_INTERVAL = 64
+
+# Seconds a worker may hold unmerged counts, so slow targets still show progress
+STATS_FLUSH_SECONDS = 1.0
+
+# URL scheme used for each supported proxy type
+PROXY_SCHEMES = {
+    'HTTP': 'http',
+    'SOCKS4': 'socks4',
+    'SOCKS5': 'socks5'
+}
+
+# Seconds the writer thread sleeps when it has nothing to write
+WRITER_POLL_INTERVAL = 0.1
+
+# Write buffer for result files
+EXPORT_BUFFER_SIZE = 1 << 20
 
 def format_time(seconds):
     """Format seconds to HH:MM:SS"""
@@ -28,8 +63,79 @@ def format_time(seconds):
 
 def ensure_directory(directory):
     """Ensure a directory exists"""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    os.makedirs(directory, exist_ok=True)
+
+class CheckResult:
+    """Outcome of checking a single account"""
+    
+    __slots__ = ('username', 'password', 'proxy', 'success', 'failure',
+                 'error', 'error_message', 'captured_data')
+    
+    def __init__(self, username, password, proxy='None'):
+        """Initialize an unchecked result"""
+        self.username = username
+        self.password = password
+        self.proxy = proxy
+        self.success = False
+        self.failure = False
+        self.error = False
+        self.error_message = ''
+        self.captured_data = {}
+    
+    def update(self, check_result):
+        """Copy the fields of a check_with_config result dictionary"""
+        self.success = check_result.get('success', False)
+        self.failure = check_result.get('failure', False)
+        self.error = check_result.get('error', False)
+        self.error_message = check_result.get('error_message', '')
+        self.captured_data = check_result.get('captured_data', {})
+
+# Per-process state used by check_one in --processes mode
+_worker_config = None
+_worker_client = None
+
+def _init_worker(config, timeout):
+    """Set up the compiled config and HTTP client of a checker process"""
+    global _worker_config, _worker_client
+    _worker_config = CompiledConfig.from_raw(config)
+    _worker_client = HttpClient(timeout=timeout)
+
+def check_one(combo, proxy):
+    """Check a single (username, password) combo in a checker process"""
+    username = combo[0].decode('utf-8', 'ignore')
+    password = combo[1].decode('utf-8', 'ignore')
+    
+    result = CheckResult(username, password, str(proxy) if proxy else 'None')
+    _worker_client.set_proxy(proxy)
+    result.update(_worker_client.check_with_config(username, password, _worker_config))
+    return f"{username}:{password}", result
+
+class TokenBucket:
+    """Token bucket shared by worker threads to cap checks per second"""
+    
+    def __init__(self, rate):
+        """Initialize the bucket with a refill rate in tokens per second"""
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.condition = threading.Condition()
+    
+    def acquire(self):
+        """Block until a token is available and consume it"""
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                self.condition.wait((1 - self.tokens) / self.rate)
 
 class ConsoleChecker:
     """CLI version of CyberChecker for testing and basic usage"""
@@ -50,14 +156,28 @@ class ConsoleChecker:
             'last_cpm_update': 0
         }
         
-        # Results storage
-        self.hits = []
-        self.free = []
-        self.logs = []
+        # Results are streamed to disk by a writer thread while checking
+        self.logs = []  # Log lines buffered until the writer starts
+        self.result_files = {}
+        self.result_counts = {}
+        self._writer_dq = None
+        self._writer_stop = threading.Event()
+        self._writer_thread = None
+        
+        # Last (checked, total, elapsed) drawn by display_progress
+        self._last_display = None
+        
+        # Log output
+        self._last_log_sec = -1
+        self._last_log_str = ''
+        self._output_lock = threading.Lock()
         
         # Worker control
         self.is_checking = False
         self.pause_event = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._bucket = None
+        self._proxy_dicts = []
         
         # Initialize dirs
         ensure_directory('configs')
@@ -65,10 +185,21 @@ class ConsoleChecker:
     
     def log(self, message):
         """Add a log message"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        log_line = f"[{timestamp}] {message}"
-        self.logs.append(log_line)
-        print(log_line)
+        # Timestamps only change once a second, so reuse the formatted one
+        sec = int(time.time())
+        if sec != self._last_log_sec:
+            self._last_log_str = time.strftime('%H:%M:%S', time.localtime(sec))
+            self._last_log_sec = sec
+        
+        log_line = f"[{self._last_log_str}] {message}"
+        writer_dq = self._writer_dq
+        if writer_dq is not None:
+            writer_dq.append(('log', log_line))
+        else:
+            self.logs.append(log_line)
+        
+        with self._output_lock:
+            sys.stdout.write(log_line + '\n')
     
     def list_configs(self):
         """List available configurations"""
@@ -81,7 +212,7 @@ class ConsoleChecker:
         for i, config_name in enumerate(configs, 1):
             self.log(f"{i}. {config_name}")
     
-    def check_combo(self, config_name, combo_file, proxy_file=None, proxy_type='None', threads=10, timeout=10):
+    def check_combo(self, config_name, combo_file, proxy_file=None, proxy_type='None', threads=DEFAULT_THREADS, timeout=10, max_cpm=None, processes=0):
         """Main checking function"""
         # Load config
         config = self.config_manager.load_config(config_name)
@@ -89,6 +220,9 @@ class ConsoleChecker:
             self.log(f"Error: Config '{config_name}' not found.")
             return False
         
+        # Compile patterns and conditions once for all workers
+        compiled = CompiledConfig.from_raw(config)
+        
         # Check combo file
         if not os.path.exists(combo_file):
             self.log(f"Error: Combo file '{combo_file}' not found.")
@@ -111,81 +245,135 @@ class ConsoleChecker:
                 self.log(f"Error reading proxies file: {str(e)}")
                 return False
         
-        # Count lines to update tocheck
+        # Start the checker processes before the combo and result files are opened,
+        # so the forked processes don't inherit their handles or the writer thread's state
+        process_pool = None
+        if processes:
+            try:
+                # Each process compiles the config and opens its own session once
+                process_pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                                   initargs=(compiled.raw, timeout))
+                
+                # Launch the processes now rather than on the first submit
+                process_pool.submit(int).result()
+            except Exception as e:
+                if process_pool:
+                    process_pool.shutdown(wait=False, cancel_futures=True)
+                self.log(f"Error starting checker processes: {str(e)}")
+                return False
+        
+        # Open the combo file; lines are streamed to workers as they are read
         try:
-            with open(combo_file, 'r', encoding='utf-8', errors='ignore') as f:
-                line_count = sum(1 for _ in f)
-            self.stats['tocheck'] = line_count
-            self.log(f"Loaded combo file: {os.path.basename(combo_file)} ({line_count} lines)")
+            combo_iter = self._iter_combos(combo_file)
         except Exception as e:
-            self.log(f"Error counting lines in combo file: {str(e)}")
+            if process_pool:
+                process_pool.shutdown(wait=False, cancel_futures=True)
+            self.log(f"Error reading combo file: {str(e)}")
             return False
         
-        # Reset stats
+        self.log(f"Loaded combo file: {os.path.basename(combo_file)}")
+        
+        # Reset stats; tocheck stays unknown until the whole file has been read
         self.stats = {
             'checked': 0,
             'hits': 0,
-            'tocheck': line_count,
+            'tocheck': None,
+            'produced': 0,
             'deads': 0,
-            'start_time': time.time(),
+            'start_time': time.monotonic(),
             'cpm': 0,
             'last_checked': 0,
-            'last_cpm_update': time.time()
+            'last_cpm_update': time.monotonic()
         }
         
-        # Clear previous results
-        self.hits = []
-        self.free = []
-        
-        self.log(f"Starting checking process with {threads} threads and {timeout}s timeout...")
-        
-        # Create a queue for combo lines
-        combo_queue = queue.Queue()
-        
-        # Fill the queue with combo lines
+        # Open the result files
         try:
-            with open(combo_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and ':' in line:
-                        combo_queue.put(line)
+            self._start_writer()
         except Exception as e:
-            self.log(f"Error reading combo file: {str(e)}")
+            combo_iter.close()
+            if process_pool:
+                process_pool.shutdown(wait=False, cancel_futures=True)
+            self.log(f"Error opening result files: {str(e)}")
             return False
         
-        # Start worker threads
+        if processes:
+            self.log(f"Starting checking process with {processes} processes and {timeout}s timeout...")
+        else:
+            self.log(f"Starting checking process with {threads} threads and {timeout}s timeout...")
+        
+        # Start the worker pool
         self.is_checking = True
         self.pause_event.clear()
-        self.worker_threads = []
-        
-        for _ in range(threads):
-            t = threading.Thread(
-                target=self.worker_thread,
-                args=(combo_queue, config, proxies, proxy_type, timeout, self.pause_event),
-                daemon=True
-            )
-            t.start()
-            self.worker_threads.append(t)
-        
-        # Monitor progress
+        self._proxy_index = 0
+        
+        # Build each proxy dict once; workers share them read-only
+        scheme = PROXY_SCHEMES.get(proxy_type)
+        self._proxy_dicts = [{'http': f'{scheme}://{p}', 'https': f'{scheme}://{p}'} for p in proxies] if scheme else []
+        self._thread_local = threading.local()
+        self._stat_batches = []
+        self._last_display = None
+        
+        # Rate limiting is opt-in; without it workers run as fast as the target allows
+        self._bucket = TokenBucket(max_cpm / 60) if max_cpm else None
+        
+        executor = process_pool
+        previous_stack_size = None
+        pending = set()
+        last_display = 0
+        
         try:
-            while self.is_checking and any(t.is_alive() for t in self.worker_threads):
-                self.update_stats()
-                self.display_progress()
+            previous_stack_size = threading.stack_size(WORKER_STACK_SIZE)
+            if processes:
+                client_pool = None
+                workers = processes
+            else:
+                # One reusable client per worker, created before dispatch
+                client_pool = HttpClientPool(threads, timeout=timeout)
+                workers = threads
+                executor = ThreadPoolExecutor(max_workers=threads)
+            
+            while self.is_checking:
+                # Keep a bounded number of combos in flight
+                while len(pending) < workers * MAX_PENDING_PER_THREAD:
+                    combo = next(combo_iter, None)
+                    if combo is None:
+                        self.stats['tocheck'] = self.stats['produced']
+                        break
+                    self.stats['produced'] += 1
+                    proxy = self._pick_proxy()
+                    
+                    if processes:
+                        # Rate limit at submission; the processes can't share the bucket
+                        if self._bucket:
+                            self._bucket.acquire()
+                        future = executor.submit(check_one, combo, proxy)
+                        future.add_done_callback(self._on_process_result)
+                    else:
+                        future = executor.submit(self._check_one, combo, compiled, proxy, client_pool)
+                    pending.add(future)
                 
                 # Check if all done
-                if self.stats['checked'] >= self.stats['tocheck']:
+                if not pending:
                     self.is_checking = False
                     break
                 
-                time.sleep(1)
-            
-            # Ensure we join all threads
-            for t in self.worker_threads:
-                t.join(0.1)
+                _, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
                 
+                # Monitor progress (monotonic, so wall-clock jumps don't skew elapsed or CPM)
+                now = time.monotonic()
+                if now - last_display >= 1:
+                    self.update_stats()
+                    self.display_progress()
+                    last_display = now
+            
+            executor.shutdown(wait=True)
+            
+            # Merge counts the workers have not flushed yet
+            for batch in self._stat_batches:
+                self._flush_stats(batch)
+            
             # Display final stats
-            self.update_stats()
+            self.update_stats(force=True)
             self.display_progress()
             self.log("Checking completed.")
             
@@ -199,94 +387,145 @@ class ConsoleChecker:
             self.pause_event.set()
             self.is_checking = False
             
-            # Wait for threads to finish
-            for t in self.worker_threads:
-                t.join(0.1)
+            if executor:
+                # Drop queued combos and give running checks one request timeout to record their results
+                running = [future for future in pending if not future.cancel()]
+                executor.shutdown(wait=False, cancel_futures=True)
+                _, running = wait(running, timeout=timeout)
+                if running:
+                    self.log(f"Abandoned {len(running)} checks still running; their results are not saved.")
+            
+            # Merge counts the workers have not flushed yet
+            for batch in self._stat_batches:
+                self._flush_stats(batch)
             
             self.log("Stopped.")
+            
+            # Keep whatever was found before the interrupt
+            self.export_results()
             return False
+        
+        finally:
+            combo_iter.close()
+            if previous_stack_size is not None:
+                threading.stack_size(previous_stack_size)
+            
+            # Release the pool and result files if the run failed; no-ops once already done
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            self.export_results()
     
-    def worker_thread(self, queue, config, proxies, proxy_type, timeout, pause_event):
-        """Worker thread for checking"""
-        http_client = HttpClient(timeout=timeout)
+    def _iter_combos(self, combo_file):
+        """Map the combo file and return a generator of raw (username, password) byte pairs"""
+        f = open(combo_file, 'rb')
+        try:
+            # Empty files cannot be mapped
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else None
+        except Exception:
+            f.close()
+            raise
         
-        proxy_index = 0
-        proxy = None
+        def generate():
+            with f:
+                if mm is None:
+                    return
+                with mm:
+                    for raw in iter(mm.readline, b''):
+                        username, sep, password = raw.strip().partition(b':')
+                        if sep:
+                            yield username, password
         
-        while not pause_event.is_set():
-            try:
-                # Get next combo line
-                try:
-                    combo_line = queue.get(block=False)
-                except queue.Empty:
-                    # No more work to do
-                    break
-                
-                # Set proxy if needed
-                if proxies and proxy_type != 'None':
-                    if proxy_index >= len(proxies):
-                        proxy_index = 0
-                    
-                    proxy_str = proxies[proxy_index]
-                    proxy_index += 1
-                    
-                    try:
-                        if proxy_type == 'HTTP':
-                            proxy = {
-                                'http': f'http://{proxy_str}',
-                                'https': f'http://{proxy_str}'
-                            }
-                        elif proxy_type == 'SOCKS4':
-                            proxy = {
-                                'http': f'socks4://{proxy_str}',
-                                'https': f'socks4://{proxy_str}'
-                            }
-                        elif proxy_type == 'SOCKS5':
-                            proxy = {
-                                'http': f'socks5://{proxy_str}',
-                                'https': f'socks5://{proxy_str}'
-                            }
-                        
-                        http_client.set_proxy(proxy)
-                    except Exception as e:
-                        print(f"Error setting proxy: {str(e)}")
-                        http_client.clear_proxy()
-                
-                # Parse the combo line
-                if ':' in combo_line:
-                    parts = combo_line.split(':', 1)
-                    username, password = parts[0], parts[1]
-                    
-                    # Check the account
-                    result = self.check_account(username, password, config, http_client, proxy)
-                    
-                    # Process the result
-                    self.process_result(result, combo_line)
-                    
-                    # Mark as checked
-                    with threading.Lock():
-                        self.stats['checked'] += 1
-                
-                # Small delay to prevent hammering
-                time.sleep(0.05)
-                
-            except Exception as e:
-                print(f"Worker error: {str(e)}")
-                # Continue to next combo
-                continue
+        return generate()
+    
+    def _pick_proxy(self):
+        """Get the next proxy in rotation, or None when proxies are disabled"""
+        if not self._proxy_dicts:
+            return None
+        
+        if self._proxy_index >= len(self._proxy_dicts):
+            self._proxy_index = 0
+        
+        proxy = self._proxy_dicts[self._proxy_index]
+        self._proxy_index += 1
+        return proxy
+    
+    def _check_one(self, combo, config, proxy, client_pool):
+        """Check a single (username, password) combo on a worker thread"""
+        if self.pause_event.is_set():
+            return
+        
+        if self._bucket:
+            self._bucket.acquire()
+            
+            # The run may have been stopped while waiting for a token
+            if self.pause_event.is_set():
+                return
+        
+        http_client = client_pool.get()
+        try:
+            if proxy:
+                http_client.set_proxy(proxy)
+            
+            # Decode only the two fields the config needs
+            username = combo[0].decode('utf-8', 'ignore')
+            password = combo[1].decode('utf-8', 'ignore')
+            combo_line = f"{username}:{password}"
+            
+            # Check the account
+            result = self.check_account(username, password, config, http_client, proxy)
+            
+            # Process the result
+            self.process_result(result, combo_line)
+            self._mark_checked()
+        
+        except Exception as e:
+            print(f"Worker error: {str(e)}")
+        
+        finally:
+            client_pool.put(http_client)
+    
+    def _on_process_result(self, future):
+        """Process the result of a check_one call made in a checker process"""
+        if future.cancelled():
+            return
+        
+        try:
+            combo_line, result = future.result()
+            self.process_result(result, combo_line)
+            self._mark_checked()
+        except Exception as e:
+            print(f"Worker error: {str(e)}")
+    
+    def _mark_checked(self):
+        """Count one checked combo in the current thread's stat batch"""
+        batch = self._stat_batch()
+        batch['checked'] += 1
+        now = time.monotonic()
+        if batch['checked'] >= STATS_FLUSH_INTERVAL or now - self._thread_local.last_flush >= STATS_FLUSH_SECONDS:
+            self._flush_stats(batch)
+            self._thread_local.last_flush = now
+    
+    def _stat_batch(self):
+        """Get the stat counters owned by the current worker thread"""
+        batch = getattr(self._thread_local, 'stat_batch', None)
+        if batch is None:
+            batch = {'checked': 0, 'hits': 0, 'deads': 0}
+            self._thread_local.stat_batch = batch
+            self._thread_local.last_flush = time.monotonic()
+            with self._stats_lock:
+                self._stat_batches.append(batch)
+        return batch
+    
+    def _flush_stats(self, batch):
+        """Merge a worker's local counters into the shared stats"""
+        with self._stats_lock:
+            for key, value in batch.items():
+                self.stats[key] += value
+                batch[key] = 0
     
     def check_account(self, username, password, config, http_client, proxy=None):
         """Check an account using the selected config"""
-        result = {
-            'username': username,
-            'password': password,
-            'proxy': str(proxy) if proxy else 'None',
-            'success': False,
-            'failure': False,
-            'error': False,
-            'error_message': '',
-            'captured_data': {}
-        }
+        result = CheckResult(username, password, str(proxy) if proxy else 'None')
         
         try:
             # Check the account using the configuration
@@ -296,27 +535,25 @@ class ConsoleChecker:
             result.update(check_result)
             
         except Exception as e:
-            result['error'] = True
-            result['error_message'] = str(e)
+            result.error = True
+            result.error_message = str(e)
         
         return result
     
     def process_result(self, result, combo_line):
         """Process a result from a worker thread"""
-        if result['error']:
+        if result.error:
             # Handle error
-            with threading.Lock():
-                self.stats['deads'] += 1
+            self._stat_batch()['deads'] += 1
             return
         
-        if result['success']:
+        if result.success:
             # Handle hit
-            with threading.Lock():
-                self.stats['hits'] += 1
+            self._stat_batch()['hits'] += 1
             
             # Format the result for display
             captured = []
-            for name, value in result['captured_data'].items():
+            for name, value in result.captured_data.items():
                 captured.append(f"{name}: {value}")
             
             capture_text = ' | '.join(captured) if captured else ''
@@ -326,22 +563,28 @@ class ConsoleChecker:
                 display_text += f" | {capture_text}"
             
             # Add to hits
-            self.hits.append(display_text)
-        elif result['failure']:
+            self._write_result('hit', display_text)
+        elif result.failure:
             # Handle dead
-            with threading.Lock():
-                self.stats['deads'] += 1
+            self._stat_batch()['deads'] += 1
         else:
             # Handle free (neither hit nor explicitly dead)
-            self.free.append(combo_line)
+            self._write_result('free', combo_line)
     
-    def update_stats(self):
-        """Update the statistics"""
-        current_time = time.time()
+    def update_stats(self, force=False):
+        """Update the statistics; force sets the final CPM from the whole run"""
+        current_time = time.monotonic()
         elapsed = current_time - self.stats.get('start_time', current_time)
         
+        if force:
+            # Counts merged at the end would skew a one-second window, so average instead
+            if elapsed > 0:
+                self.stats['cpm'] = self.stats['checked'] * 60 / elapsed
+            self.stats['last_checked'] = self.stats['checked']
+            self.stats['last_cpm_update'] = current_time
+        
         # Only update CPM every second
-        if current_time - self.stats.get('last_cpm_update', 0) >= 1.0:
+        elif current_time - self.stats.get('last_cpm_update', 0) >= 1.0:
             # Calculate checks in the last interval
             checks_diff = self.stats['checked'] - self.stats.get('last_checked', 0)
             self.stats['last_checked'] = self.stats['checked']
@@ -357,58 +600,116 @@ class ConsoleChecker:
     
     def display_progress(self):
         """Display progress in terminal"""
-        current_time = time.time()
-        elapsed = current_time - self.stats.get('start_time', current_time)
-        elapsed_str = format_time(int(elapsed))
+        current_time = time.monotonic()
+        elapsed = int(current_time - self.stats.get('start_time', current_time))
+        total = self.stats['tocheck'] if self.stats['tocheck'] is not None else self.stats['produced']
+        
+        # Skip the redraw when nothing visible has changed
+        display_key = (self.stats['checked'], total, elapsed)
+        if display_key == self._last_display:
+            return
+        self._last_display = display_key
+        
+        elapsed_str = format_time(elapsed)
         
-        # Calculate progress percentage
-        if self.stats['tocheck'] > 0:
-            progress = (self.stats['checked'] / self.stats['tocheck']) * 100
+        # Calculate progress percentage; until the file is fully read, measure against lines read so far
+        if total > 0:
+            progress = (self.stats['checked'] / total) * 100
         else:
             progress = 0
         
         # Clear line and print status
-        sys.stdout.write('\r' + ' ' * 80 + '\r')
         status = (
             f"Progress: {progress:.1f}% | "
-            f"Checked: {self.stats['checked']}/{self.stats['tocheck']} | "
+            f"Checked: {self.stats['checked']}/{total} | "
             f"Hits: {self.stats['hits']} | "
             f"CPM: {int(self.stats['cpm'])} | "
             f"Elapsed: {elapsed_str}"
         )
-        sys.stdout.write(status)
-        sys.stdout.flush()
+        with self._output_lock:
+            sys.stdout.write('\r' + ' ' * 80 + '\r' + status)
+            sys.stdout.flush()
     
-    def export_results(self):
-        """Export results to files"""
+    def _start_writer(self):
+        """Open the result files and start the thread that writes to them"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         results_dir = 'results'
         ensure_directory(results_dir)
         
         # Define filenames
-        hits_file = os.path.join(results_dir, f"hits_{timestamp}.txt")
-        free_file = os.path.join(results_dir, f"free_{timestamp}.txt")
-        log_file = os.path.join(results_dir, f"log_{timestamp}.txt")
-        
-        # Export hits
-        with open(hits_file, 'w', encoding='utf-8') as f:
-            for line in self.hits:
-                f.write(line + '\n')
-        
-        # Export free
-        with open(free_file, 'w', encoding='utf-8') as f:
-            for line in self.free:
-                f.write(line + '\n')
-        
-        # Export logs
-        with open(log_file, 'w', encoding='utf-8') as f:
-            for line in self.logs:
-                f.write(line + '\n')
-        
-        self.log(f"\nResults exported to '{results_dir}' directory:")
-        self.log(f"- Hits: {len(self.hits)} saved to {hits_file}")
-        self.log(f"- Free: {len(self.free)} saved to {free_file}")
-        self.log(f"- Logs: {len(self.logs)} saved to {log_file}")
+        self.result_files = {
+            'hit': os.path.join(results_dir, f"hits_{timestamp}.txt"),
+            'free': os.path.join(results_dir, f"free_{timestamp}.txt"),
+            'log': os.path.join(results_dir, f"log_{timestamp}.txt")
+        }
+        self.result_counts = {'hit': 0, 'free': 0, 'log': 0}
+        
+        files = {}
+        try:
+            for kind, path in self.result_files.items():
+                files[kind] = open(path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE)
+        except Exception:
+            for f in files.values():
+                f.close()
+            raise
+        
+        # Seed the log file with lines logged before checking started
+        writer_dq = deque(('log', line) for line in self.logs)
+        self.logs = []
+        
+        self._writer_dq = writer_dq
+        self._writer_stop.clear()
+        self._writer_thread = threading.Thread(target=self._writer_loop, args=(writer_dq, files), daemon=True)
+        self._writer_thread.start()
+    
+    def _write_result(self, kind, line):
+        """Queue a result line for the writer; dropped once results are exported"""
+        writer_dq = self._writer_dq
+        if writer_dq is not None:
+            writer_dq.append((kind, line))
+    
+    def _writer_loop(self, writer_dq, files):
+        """Write tagged result lines to their files until asked to stop"""
+        # deque append/popleft are atomic, so producers never take a lock
+        dirty = False
+        try:
+            while True:
+                try:
+                    kind, line = writer_dq.popleft()
+                except IndexError:
+                    # Flush whenever the backlog is drained so results survive a crash
+                    if dirty:
+                        for f in files.values():
+                            f.flush()
+                        dirty = False
+                    
+                    if self._writer_stop.is_set() and not writer_dq:
+                        break
+                    self._writer_stop.wait(WRITER_POLL_INTERVAL)
+                    continue
+                
+                files[kind].write(line + '\n')
+                self.result_counts[kind] += 1
+                dirty = True
+        finally:
+            for f in files.values():
+                f.close()
+    
+    def export_results(self):
+        """Finish writing results to files"""
+        if self._writer_thread is None:
+            return
+        
+        # Stop the writer after it has drained everything queued so far
+        self._writer_stop.set()
+        self._writer_thread.join()
+        self._writer_dq = None
+        self._writer_thread = None
+        
+        self.log(f"\nResults exported to 'results' directory:")
+        self.log(f"- Hits: {self.result_counts['hit']} saved to {self.result_files['hit']}")
+        self.log(f"- Free: {self.result_counts['free']} saved to {self.result_files['free']}")
+        self.log(f"- Logs: {self.result_counts['log']} saved to {self.result_files['log']}")
 
 
 def main():
@@ -428,13 +729,24 @@ def main():
     check_parser.add_argument('-p', '--proxy', help='Path to proxy file (optional)')
     check_parser.add_argument('-t', '--proxy-type', choices=['None', 'HTTP', 'SOCKS4', 'SOCKS5'], 
                          default='None', help='Proxy type (default: None)')
-    check_parser.add_argument('-n', '--threads', type=int, default=10,
-                         help='Number of threads (default: 10)')
+    check_parser.add_argument('-n', '--threads', type=int, default=DEFAULT_THREADS,
+                         help=f'Number of threads (default: {DEFAULT_THREADS})')
     check_parser.add_argument('-o', '--timeout', type=int, default=10,
                          help='Request timeout in seconds (default: 10)')
+    check_parser.add_argument('-m', '--max-cpm', type=int, default=None,
+                         help='Maximum checks per minute across all threads (default: unlimited)')
+    check_parser.add_argument('-P', '--processes', type=int, default=0,
+                         help='Run checks in this many worker processes instead of threads (default: 0, threads only)')
     
     args = parser.parse_args()
     
+    # Reject values the checker can't run with
+    if args.command == 'check':
+        if args.max_cpm is not None and args.max_cpm < 0:
+            check_parser.error('--max-cpm must be 0 or greater')
+        if args.processes < 0:
+            check_parser.error('--processes must be 0 or greater')
+    
     checker = ConsoleChecker()
     checker.log("CyberChecker CLI Mode")
     
@@ -447,7 +759,9 @@ def main():
             args.proxy,
             args.proxy_type,
             args.threads,
-            args.timeout
+            args.timeout,
+            args.max_cpm,
+            args.processes
         )
     else:
         parser.print_help()
@@ -9,17 +9,24 @@ In environments with a display, it will run the Kivy GUI.
 
 import os
 import sys
+import time
 import platform
 
-# Check if we're running in a headless environment (like Replit)
-is_replit = 'REPLIT_DB_URL' in os.environ
-is_headless = is_replit or os.environ.get('DISPLAY') is None
+# Bound once for the log timestamp fast path
+_localtime = time.localtime
 
-if is_replit:
+# Check if we're running in a headless environment (like Replit);
+# the environment is probed once here and the results reused everywhere else
+_env = os.environ
+IS_REPLIT = 'REPLIT_DB_URL' in _env
+IS_HEADLESS = IS_REPLIT or _env.get('DISPLAY') is None
+
+if IS_REPLIT:
     print("Running in Replit environment - Headless mode enabled")
     
-if is_headless:
-    # In headless environments, use the CLI mode
+
+def _run_cli():
+    """Run the CLI checker (headless environments)"""
     try:
         from cli_checker import main as cli_main
         cli_main()
@@ -27,8 +34,10 @@ if is_headless:
         print(f"Error importing CLI mode: {e}")
         print("Please run 'python cli_checker.py' directly for CLI mode.")
         sys.exit(1)
-else:
-    # In environments with a display, use the Kivy GUI
+
+
+def _run_gui():
+    """Import Kivy and run the GUI (environments with a display)"""
     try:
         import kivy
         from kivy.app import App
@@ -39,28 +48,62 @@ else:
         from kivy.uix.label import Label
         from kivy.uix.spinner import Spinner
         from kivy.uix.textinput import TextInput
-        from kivy.uix.filechooser import FileChooserListView
         from kivy.uix.popup import Popup
         from kivy.uix.progressbar import ProgressBar
         from kivy.clock import Clock
         from kivy.graphics import Color, Rectangle
         
-        from utils.config_manager import ConfigManager
-        from utils.http_client import HttpClient
-        from utils.ui_components import ModernLabel, ModernButton, ModernSpinner, GradientButton
+        from utils.ui_components import ModernLabel, ModernButton, ModernSpinner, GradientButton, FastFileChooser
+        
+        import re
+        import array
+        import random
+        import threading
+        
+        # {name} placeholders substituted by replace_variables
+        _VAR_RE = re.compile(r'\{([^{}]+)\}')
+        
+        # datetime is only needed once results are exported
+        _dt = None
+        
+        def _now():
+            """Get the current datetime, importing datetime on first use"""
+            nonlocal _dt
+            if _dt is None:
+                from datetime import datetime as _dt
+            return _dt.now()
+        
+        # Zero-padded two-digit strings, so format_time only indexes
+        _ZP = [f"{i:02d}" for i in range(100)]
         
         # Format time function (seconds to HH:MM:SS)
         def format_time(seconds):
             """Format seconds to HH:MM:SS"""
-            m, s = divmod(seconds, 60)
-            h, m = divmod(m, 60)
-            return f"{int(h):02d}:{int(m):02d}:{int(s):02d}"
+            h, r = divmod(int(seconds), 3600)
+            m, s = divmod(r, 60)
+            return f"{_ZP[h] if h < 100 else h}:{_ZP[m]}:{_ZP[s]}"
         
         def ensure_directory(directory):
             """Ensure a directory exists"""
             if not os.path.exists(directory):
                 os.makedirs(directory)
         
+        # Slots of MainScreen._counters
+        _CHECKED, _HITS = 0, 1
+        
+        class Stats:
+            """Checking statistics stored in fixed slots"""
+            
+            __slots__ = ('checked', 'hits', 'start_time', 'total', 'cpm')
+            
+            def __init__(self, start_time=0, total=0):
+                """Initialize all counters to zero"""
+                self.checked = 0
+                self.hits = 0
+                self.start_time = start_time
+                self.total = total
+                self.cpm = 0
+        
         class MainScreen(Screen):
             """Main application screen"""
             def __init__(self, **kwargs):
@@ -79,11 +122,49 @@ else:
                 self.worker_threads = []
                 self.combo_data = []
                 self.proxies = []
-                self.stats = {'checked': 0, 'hits': 0, 'start_time': 0}
-                
-                # Configuration and clients
-                self.config_manager = ConfigManager()
-                self.http_client = HttpClient()
+                self.stats = Stats()
+                
+                # Counters bumped by worker threads; the UI reads snapshots
+                self._counters = array.array('Q', [0, 0])
+                self._counter_lock = threading.Lock()
+                
+                # Last values written to the stats widgets, and when
+                self._ui_last = {'progress': -1, 'hits': -1, 'cpm': -1}
+                self._ui_last_push = 0.0
+                
+                # Checks per second over the last 10 seconds, for CPM
+                self._cpm_ring = [0] * 10
+                self._cpm_idx = 0
+                self._cpm_last_sec = int(Clock.get_time())
+                
+                # Popups, built on first use and reused
+                self._file_popup = None
+                self._filechooser = None
+                self._pending_target = None
+                self._error_popup = None
+                self._error_label = None
+                self._editor_popup = None
+                self._editor_spinner = None
+                self._editor_widget = None
+                
+                # Config editor text, keyed by name with the file mtime it was read at
+                self._cfg_text_cache = {}
+                
+                # Configuration and clients, created on first use
+                self._cm = None
+                self._http = None
+                
+                # Config list cache, refreshed when the configs directory changes
+                self._config_files_cache = None
+                self._config_files_mtime = 0
+                
+                # Log lines are buffered and pushed to the TextInput in batches;
+                # only the most recent lines are kept
+                from collections import deque
+                self._log_buf = deque(maxlen=5000)
+                self._log_dirty = False
+                self._ts_sec = 0
+                self._ts_str = ''
                 
                 # Header section
                 header = BoxLayout(orientation='horizontal', size_hint=(1, 0.1), spacing=10)
@@ -220,7 +301,7 @@ else:
                     size_hint=(0.33, 1),
                     background_color=(0.3, 0.3, 0.3, 1)
                 )
-                self.clear_button.bind(on_release=lambda x: setattr(self.logs, 'text', ""))
+                self.clear_button.bind(on_release=lambda x: self.clear_logs())
                 
                 advanced_buttons.add_widget(self.config_editor_button)
                 advanced_buttons.add_widget(self.export_button)
@@ -236,13 +317,28 @@ else:
                 
                 self.add_widget(self.layout)
                 
-                # Initialize the directory for configs and results
-                ensure_directory('configs')
-                ensure_directory('results')
+                # Flush buffered log lines a few times per second
+                Clock.schedule_interval(self._flush_logs, 0.25)
                 
                 # Add initial log
                 self.add_log("CyberChecker started. Select a config and load combo file to begin.")
             
+            @property
+            def config_manager(self):
+                """Configuration manager, created on first access"""
+                if self._cm is None:
+                    from utils.config_manager import ConfigManager
+                    self._cm = ConfigManager()
+                return self._cm
+            
+            @property
+            def http_client(self):
+                """HTTP client, created on first access"""
+                if self._http is None:
+                    from utils.http_client import HttpClient
+                    self._http = HttpClient()
+                return self._http
+            
             def _update_rect(self, instance, value):
                 """Update the rectangle position and size"""
                 self.rect.pos = instance.pos
@@ -250,7 +346,19 @@ else:
             
             def _get_config_files(self):
                 """Get a list of available config files"""
-                return self.config_manager.get_config_files() or ["No configs found"]
+                try:
+                    mtime = os.stat(self.config_manager.config_dir).st_mtime
+                except OSError:
+                    mtime = 0
+                
+                if self._config_files_cache is None or mtime != self._config_files_mtime:
+                    self._config_files_cache = self.config_manager.get_config_files() or ["No configs found"]
+                    self._config_files_mtime = mtime
+                return self._config_files_cache
+            
+            def _invalidate_config_cache(self):
+                """Force the next _get_config_files call to rescan the configs directory"""
+                self._config_files_cache = None
             
             def on_config_selection(self, spinner, text):
                 """Handle config selection from spinner"""
@@ -269,40 +377,64 @@ else:
             
             def load_combo(self, instance):
                 """Open file chooser to load combo file"""
-                popup = Popup(
-                    title="Select Combo File",
-                    size_hint=(0.8, 0.8),
-                    auto_dismiss=True
-                )
-                
-                layout = BoxLayout(orientation='vertical')
-                filechooser = FileChooserListView(
-                    path=os.getcwd(),
-                    filters=['*.txt']
-                )
-                
-                buttons = BoxLayout(size_hint=(1, 0.1))
-                cancel_button = ModernButton(text="Cancel")
-                select_button = ModernButton(text="Select")
-                
-                cancel_button.bind(on_release=popup.dismiss)
-                select_button.bind(on_release=lambda x: self._on_combo_selected(filechooser.selection, popup))
-                
-                buttons.add_widget(cancel_button)
-                buttons.add_widget(select_button)
-                
-                layout.add_widget(filechooser)
-                layout.add_widget(buttons)
-                
-                popup.content = layout
-                popup.open()
+                self._open_file_popup("Select Combo File", 'combo')
+            
+            def _open_file_popup(self, title, target):
+                """Open the shared file chooser popup for the 'combo' or 'proxies' target"""
+                if self._file_popup is None:
+                    popup = Popup(
+                        size_hint=(0.8, 0.8),
+                        auto_dismiss=True
+                    )
+                    
+                    layout = BoxLayout(orientation='vertical')
+                    self._filechooser = FastFileChooser(
+                        path=os.getcwd(),
+                        filters=['*.txt']
+                    )
+                    
+                    buttons = BoxLayout(size_hint=(1, 0.1))
+                    cancel_button = ModernButton(text="Cancel")
+                    select_button = ModernButton(text="Select")
+                    
+                    cancel_button.bind(on_release=popup.dismiss)
+                    select_button.bind(on_release=lambda x: self._on_file_selected())
+                    
+                    buttons.add_widget(cancel_button)
+                    buttons.add_widget(select_button)
+                    
+                    layout.add_widget(self._filechooser)
+                    layout.add_widget(buttons)
+                    
+                    popup.content = layout
+                    self._file_popup = popup
+                
+                self._pending_target = target
+                self._file_popup.title = title
+                # Rescan on every open so newly created files show up
+                cwd = os.getcwd()
+                if self._filechooser.path != cwd:
+                    self._filechooser.path = cwd
+                else:
+                    self._filechooser.refresh()
+                self._file_popup.open()
+            
+            def _on_file_selected(self):
+                """Dispatch the file chooser selection to the pending target"""
+                if self._pending_target == 'combo':
+                    self._on_combo_selected(self._filechooser.selection, self._file_popup)
+                else:
+                    self._on_proxies_selected(self._filechooser.selection, self._file_popup)
             
             def _on_combo_selected(self, selection, popup):
                 """Handle combo file selection"""
                 if selection:
                     try:
-                        with open(selection[0], 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = [line.strip() for line in f if line.strip() and ":" in line]
+                        # Split and filter as bytes; only kept lines are decoded
+                        with open(selection[0], 'rb') as f:
+                            data = f.read()
+                        stripped = (line.strip() for line in data.splitlines())
+                        lines = [line.decode('utf-8', 'ignore') for line in stripped if line and b":" in line]
                         
                         self.combo_data = lines
                         self.add_log(f"Loaded {len(lines)} combos from {os.path.basename(selection[0])}")
@@ -314,40 +446,16 @@ else:
             
             def load_proxies(self, instance):
                 """Open file chooser to load proxies file"""
-                popup = Popup(
-                    title="Select Proxies File",
-                    size_hint=(0.8, 0.8),
-                    auto_dismiss=True
-                )
-                
-                layout = BoxLayout(orientation='vertical')
-                filechooser = FileChooserListView(
-                    path=os.getcwd(),
-                    filters=['*.txt']
-                )
-                
-                buttons = BoxLayout(size_hint=(1, 0.1))
-                cancel_button = ModernButton(text="Cancel")
-                select_button = ModernButton(text="Select")
-                
-                cancel_button.bind(on_release=popup.dismiss)
-                select_button.bind(on_release=lambda x: self._on_proxies_selected(filechooser.selection, popup))
-                
-                buttons.add_widget(cancel_button)
-                buttons.add_widget(select_button)
-                
-                layout.add_widget(filechooser)
-                layout.add_widget(buttons)
-                
-                popup.content = layout
-                popup.open()
+                self._open_file_popup("Select Proxies File", 'proxies')
             
             def _on_proxies_selected(self, selection, popup):
                 """Handle proxies file selection"""
                 if selection:
                     try:
-                        with open(selection[0], 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = [line.strip() for line in f if line.strip()]
+                        with open(selection[0], 'rb') as f:
+                            data = f.read()
+                        stripped = (line.strip() for line in data.splitlines())
+                        lines = [line.decode('utf-8', 'ignore') for line in stripped if line]
                         
                         self.proxies = lines
                         self.add_log(f"Loaded {len(lines)} proxies from {os.path.basename(selection[0])}")
@@ -378,21 +486,23 @@ else:
                     return
                 
                 # Load the configuration
+                ensure_directory('configs')
                 config = self.config_manager.load_config(self.config_spinner.text)
                 if not config:
                     self.show_error(f"Failed to load configuration: {self.config_spinner.text}")
                     return
                 
                 # Reset statistics
-                self.stats = {
-                    'checked': 0,
-                    'hits': 0,
-                    'start_time': Clock.get_time(),
-                    'total': len(self.combo_data),
-                    'cpm': 0,
-                    'last_checked': 0,
-                    'last_cpm_update': Clock.get_time()
-                }
+                self.stats = Stats(start_time=Clock.get_time(), total=len(self.combo_data))
+                with self._counter_lock:
+                    self._counters[_CHECKED] = 0
+                    self._counters[_HITS] = 0
+                self._ui_last = {'progress': -1, 'hits': -1, 'cpm': -1}
+                
+                # Checks per second over the last 10 seconds, for CPM
+                self._cpm_ring = [0] * 10
+                self._cpm_idx = 0
+                self._cpm_last_sec = int(Clock.get_time())
                 
                 # Update UI
                 self.start_button.disabled = True
@@ -400,7 +510,7 @@ else:
                 self.is_checking = True
                 
                 # Clear logs
-                self.logs.text = ""
+                self.clear_logs()
                 self.add_log(f"Starting check with config: {self.config_spinner.text}")
                 self.add_log(f"Total combos to check: {len(self.combo_data)}")
                 
@@ -455,10 +565,9 @@ else:
             
             def replace_variables(self, text, variables):
                 """Replace variables in text with their values"""
-                result = text
-                for key, value in variables.items():
-                    result = result.replace(f"{{{key}}}", value)
-                return result
+                if '{' not in text:
+                    return text
+                return _VAR_RE.sub(lambda m: variables.get(m.group(1), m.group(0)), text)
             
             def process_result(self, result, combo_line):
                 """Process a result from a worker thread"""
@@ -470,38 +579,30 @@ else:
                 if not self.is_checking:
                     return
                 
-                # Simulate checking progress (in a real app, this would be actual data)
-                self.stats['checked'] += 1
+                # Hot path: bind the stats object and the clock reading once per tick
+                s = self.stats
+                now = Clock.get_time()
+                
+                # Simulate checking progress (in a real app, workers would bump the counters)
+                self.bump(_CHECKED)
+                self._count_cpm(now)
                 
                 # Randomly add hits in the simulation
-                import random
                 if random.random() < 0.1:  # 10% chance of hit
-                    self.stats['hits'] += 1
-                
-                # Update progress bar
-                progress_value = (self.stats['checked'] / self.stats['total']) * 100
-                self.progress_bar.value = progress_value
-                
-                # Update hits display
-                self.hits_count.text = str(self.stats['hits'])
-                
-                # Update CPM
-                current_time = Clock.get_time()
-                if current_time - self.stats.get('last_cpm_update', 0) >= 1.0:
-                    # Calculate checks in the last interval
-                    checks_diff = self.stats['checked'] - self.stats.get('last_checked', 0)
-                    self.stats['last_checked'] = self.stats['checked']
-                    self.stats['last_cpm_update'] = current_time
-                    
-                    # Update CPM with some smoothing
-                    new_cpm = checks_diff * 60  # Convert to per minute
-                    if self.stats['cpm'] == 0:
-                        self.stats['cpm'] = new_cpm
-                    else:
-                        # Smooth CPM changes
-                        self.stats['cpm'] = int((self.stats['cpm'] * 0.6) + (new_cpm * 0.4))
+                    self.bump(_HITS)
                 
-                self.cpm_count.text = str(int(self.stats['cpm']))
+                # Snapshot the worker counters
+                counters = self._counters
+                s.checked, s.hits = counters[_CHECKED], counters[_HITS]
+                
+                # Progress percentage
+                progress_value = (s.checked / s.total) * 100
+                
+                # Update CPM from the last 10 seconds of checks
+                s.cpm = sum(self._cpm_ring) * 6
+                
+                # Update progress bar, hits and CPM displays
+                self._push_ui(progress_value, s.hits, s.cpm, now, force=s.checked >= s.total)
                 
                 # Add an occasional log message in the simulation
                 if random.random() < 0.2:  # 20% chance of log message
@@ -509,15 +610,52 @@ else:
                         combo = random.choice(self.combo_data)
                         self.add_log(f"Hit: {combo}")
                     else:
-                        self.add_log(f"Checked {self.stats['checked']} of {self.stats['total']}")
+                        self.add_log(f"Checked {s.checked} of {s.total}")
                 
                 # End the checking if all combos were checked
-                if self.stats['checked'] >= self.stats['total']:
+                if s.checked >= s.total:
                     self.is_checking = False
                     Clock.unschedule(self.update_progress)
-                    self.add_log(f"Check completed. Found {self.stats['hits']} hits.")
+                    self.add_log(f"Check completed. Found {s.hits} hits.")
                     self.reset_ui()
             
+            def bump(self, index):
+                """Increment a worker counter (_CHECKED or _HITS) from any thread"""
+                with self._counter_lock:
+                    self._counters[index] += 1
+            
+            def _count_cpm(self, now):
+                """Count one check in the current second of the CPM ring"""
+                sec = int(now)
+                if sec != self._cpm_last_sec:
+                    # Zero the slots of every second that has passed since the last check
+                    for _ in range(min(sec - self._cpm_last_sec, 10)):
+                        self._cpm_idx = (self._cpm_idx + 1) % 10
+                        self._cpm_ring[self._cpm_idx] = 0
+                    self._cpm_last_sec = sec
+                self._cpm_ring[self._cpm_idx] += 1
+            
+            def _push_ui(self, progress, hits, cpm, now, force=False):
+                """Write stats to the widgets at most ~10 times a second, skipping unchanged values"""
+                if not force and now - self._ui_last_push < 0.1:
+                    return
+                self._ui_last_push = now
+                
+                last = self._ui_last
+                progress = round(progress, 1)
+                if progress != last['progress']:
+                    self.progress_bar.value = progress
+                    last['progress'] = progress
+                
+                if hits != last['hits']:
+                    self.hits_count.text = str(hits)
+                    last['hits'] = hits
+                
+                cpm = int(cpm)
+                if cpm != last['cpm']:
+                    self.cpm_count.text = str(cpm)
+                    last['cpm'] = cpm
+            
             def update_stats(self, dt):
                 """Update statistics display"""
                 # Implementation would go here
@@ -525,27 +663,60 @@ else:
             
             def add_log(self, message):
                 """Add a message to the logs panel"""
-                from datetime import datetime
-                timestamp = datetime.now().strftime('%H:%M:%S')
+                # Timestamps only change once a second, so reuse the formatted one
+                sec = int(time.time())
+                if sec != self._ts_sec:
+                    self._ts_sec = sec
+                    lt = _localtime(sec)
+                    self._ts_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+                timestamp = self._ts_str
                 log_line = f"[{timestamp}] {message}\n"
                 
-                # Append to the logs TextInput
-                self.logs.text += log_line
+                # Buffer the line; _flush_logs updates the TextInput
+                self._log_buf.append(log_line)
+                self._log_dirty = True
+            
+            def _flush_logs(self, dt):
+                """Push buffered log lines to the logs panel in one update"""
+                if not self._log_dirty:
+                    return
+                
+                self.logs.text = "".join(self._log_buf)
+                self._log_dirty = False
                 
                 # Auto-scroll to the bottom
                 self.logs.cursor = (0, len(self.logs.text))
             
+            def clear_logs(self):
+                """Clear the logs panel and its buffer"""
+                self._log_buf.clear()
+                self._log_dirty = False
+                self.logs.text = ""
+            
             def show_error(self, message):
                 """Show an error popup"""
-                popup = Popup(
-                    title="Error",
-                    content=Label(text=message),
-                    size_hint=(0.6, 0.3)
-                )
-                popup.open()
+                if self._error_popup is None:
+                    self._error_label = Label()
+                    self._error_popup = Popup(
+                        title="Error",
+                        content=self._error_label,
+                        size_hint=(0.6, 0.3)
+                    )
+                
+                self._error_label.text = message
+                self._error_popup.open()
             
             def show_config_editor(self, instance):
                 """Show the config editor popup"""
+                if self._editor_popup is None:
+                    self._build_config_editor()
+                
+                # Refresh the config list; the editor keeps its text between openings
+                self._editor_spinner.values = self._get_config_files()
+                self._editor_popup.open()
+            
+            def _build_config_editor(self):
+                """Build the config editor popup once"""
                 popup = Popup(
                     title="Config Editor",
                     size_hint=(0.9, 0.9),
@@ -558,7 +729,7 @@ else:
                 config_row = BoxLayout(size_hint=(1, 0.05))
                 config_row.add_widget(Label(text="Configuration:", size_hint=(0.3, 1)))
                 
-                config_spinner = Spinner(
+                self._editor_spinner = Spinner(
                     text="Select Config",
                     values=self._get_config_files(),
                     size_hint=(0.5, 1)
@@ -566,11 +737,11 @@ else:
                 
                 new_button = ModernButton(text="New", size_hint=(0.2, 1))
                 
-                config_row.add_widget(config_spinner)
+                config_row.add_widget(self._editor_spinner)
                 config_row.add_widget(new_button)
                 
                 # Config editor
-                editor = TextInput(
+                self._editor_widget = TextInput(
                     readonly=False,
                     multiline=True,
                     background_color=(0.05, 0.05, 0.05, 1),
@@ -585,65 +756,95 @@ else:
                 save_button = ModernButton(text="Save")
                 
                 cancel_button.bind(on_release=popup.dismiss)
-                
-                def on_load(instance):
-                    if config_spinner.text not in ["Select Config", "No configs found"]:
-                        try:
-                            config_data = self.config_manager.get_config_text(config_spinner.text)
-                            if config_data:
-                                editor.text = config_data
-                            else:
-                                editor.text = "Failed to load configuration."
-                        except Exception as e:
-                            editor.text = f"Error loading configuration: {str(e)}"
-                
-                def on_save(instance):
-                    if config_spinner.text not in ["Select Config", "No configs found"]:
-                        try:
-                            # Validate JSON first
-                            import json
-                            json.loads(editor.text)
-                            
-                            # Save if valid
-                            self.config_manager.save_config(config_spinner.text, editor.text)
-                            self.add_log(f"Saved configuration: {config_spinner.text}")
-                            
-                            # Update the spinner in the main UI
-                            self.config_spinner.values = self._get_config_files()
-                            
-                            popup.dismiss()
-                        except json.JSONDecodeError as e:
-                            self.show_error(f"Invalid JSON format: {str(e)}")
-                        except Exception as e:
-                            self.show_error(f"Error saving configuration: {str(e)}")
-                
-                load_button.bind(on_release=on_load)
-                save_button.bind(on_release=on_save)
+                load_button.bind(on_release=self._on_editor_load)
+                save_button.bind(on_release=self._on_editor_save)
                 
                 button_row.add_widget(cancel_button)
                 button_row.add_widget(load_button)
                 button_row.add_widget(save_button)
                 
                 layout.add_widget(config_row)
-                layout.add_widget(editor)
+                layout.add_widget(self._editor_widget)
                 layout.add_widget(button_row)
                 
                 popup.content = layout
-                popup.open()
+                self._editor_popup = popup
+            
+            def _cached_config_text(self, name):
+                """Get a config's text, re-reading the file only when its mtime changes"""
+                path = os.path.join(self.config_manager.config_dir, f"{name}.json")
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    return None
+                
+                cached = self._cfg_text_cache.get(name)
+                if cached is None or cached[0] != mtime:
+                    cached = (mtime, self.config_manager.get_config_text(name))
+                    self._cfg_text_cache[name] = cached
+                return cached[1]
+            
+            def _on_editor_load(self, instance):
+                """Load the selected config into the editor"""
+                config_spinner = self._editor_spinner
+                editor = self._editor_widget
+                if config_spinner.text not in ["Select Config", "No configs found"]:
+                    try:
+                        config_data = self._cached_config_text(config_spinner.text)
+                        if config_data:
+                            editor.text = config_data
+                        else:
+                            editor.text = "Failed to load configuration."
+                    except Exception as e:
+                        editor.text = f"Error loading configuration: {str(e)}"
+            
+            def _on_editor_save(self, instance):
+                """Validate and save the editor contents to the selected config"""
+                config_spinner = self._editor_spinner
+                editor = self._editor_widget
+                if config_spinner.text not in ["Select Config", "No configs found"]:
+                    try:
+                        # Validate JSON first (orjson is used when installed; its
+                        # JSONDecodeError subclasses json's)
+                        import json
+                        try:
+                            from orjson import loads as json_loads
+                        except ImportError:
+                            json_loads = json.loads
+                        json_loads(editor.text)
+                        
+                        # Save if valid
+                        self.config_manager.save_config(config_spinner.text, editor.text)
+                        self.add_log(f"Saved configuration: {config_spinner.text}")
+                        self._invalidate_config_cache()
+                        
+                        # Update the spinner in the main UI
+                        self.config_spinner.values = self._get_config_files()
+                        
+                        self._editor_popup.dismiss()
+                    except json.JSONDecodeError as e:
+                        self.show_error(f"Invalid JSON format: {str(e)}")
+                    except Exception as e:
+                        self.show_error(f"Error saving configuration: {str(e)}")
             
             def export_results(self, instance):
                 """Export results to files"""
-                from datetime import datetime
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                timestamp = _now().strftime('%Y%m%d_%H%M%S')
                 
                 # Create results directory if it doesn't exist
                 ensure_directory('results')
                 
-                # Export logs
+                # Export logs straight from the buffer (including lines not yet
+                # shown in the panel), encoded once and written as raw bytes
                 log_file = os.path.join('results', f'logs_{timestamp}.txt')
                 try:
-                    with open(log_file, 'w', encoding='utf-8') as f:
-                        f.write(self.logs.text)
+                    data = memoryview("".join(self._log_buf).encode('utf-8'))
+                    fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    try:
+                        while data:
+                            data = data[os.write(fd, data):]
+                    finally:
+                        os.close(fd)
                     
                     self.add_log(f"Logs exported to {log_file}")
                 except Exception as e:
@@ -668,4 +869,12 @@ else:
     except ImportError as e:
         print(f"Error importing Kivy: {e}")
         print("Please install Kivy or run 'python cli_checker.py' for CLI mode.")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+
+if IS_HEADLESS:
+    # In headless environments, use the CLI mode
+    _run_cli()
+else:
+    # In environments with a display, use the Kivy GUI
+    _run_gui()
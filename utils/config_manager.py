@@ -5,6 +5,31 @@ Handles the loading and saving of configuration files
 
 import os
 import json
+import mmap
+
+# Use orjson for JSON encoding and decoding when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+    # orjson parses straight from a buffer, so large files can be memory-mapped
+    LOADS_BUFFERS = True
+
+    def json_dumps(data, pretty=False):
+        # orjson only indents by 2, so pretty files use the stdlib to stay in one format
+        if pretty:
+            return json.dumps(data, indent=4).encode('utf-8')
+        return orjson.dumps(data)
+except ImportError:
+    json_loads = json.loads
+    LOADS_BUFFERS = False
+
+    def json_dumps(data, pretty=False):
+        if pretty:
+            return json.dumps(data, indent=4).encode('utf-8')
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+# Config files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
 
 
 class ConfigManager:
@@ -17,37 +42,65 @@ class ConfigManager:
         """Initialize the configuration manager"""
         self.config_dir = config_dir
         os.makedirs(self.config_dir, exist_ok=True)
+        
+        # (directory mtime_ns, sorted config names) from the last listing
+        self._listing_cache = None
+        
+        # Parsed configs by path, as ((mtime_ns, size), config data)
+        self._config_cache = {}
 
     def get_config_files(self):
         """
         Get list of available configuration files.
         Returns list of config names (without extensions).
         """
-        if not os.path.exists(self.config_dir):
+        try:
+            mtime = os.stat(self.config_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        config_files = []
-        for filename in os.listdir(self.config_dir):
-            if filename.endswith(".json"):
-                config_files.append(filename[:-5])  # Remove .json extension
+        # The directory mtime only changes when configs are added, removed or renamed
+        if self._listing_cache is not None and self._listing_cache[0] == mtime:
+            return list(self._listing_cache[1])
+
+        with os.scandir(self.config_dir) as entries:
+            config_files = sorted(
+                entry.name[:-5]  # Remove .json extension
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
 
-        return sorted(config_files)
+        self._listing_cache = (mtime, tuple(config_files))
+        return config_files
 
     def load_config(self, name):
         """
         Load a configuration by name.
         Returns the configuration data as dict or None if not found.
+        The dict is shared between calls until the file changes, so
+        callers must treat it as read-only.
         """
         config_path = os.path.join(self.config_dir, f"{name}.json")
         
-        if not os.path.exists(config_path):
-            return None
-        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            with open(config_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                version = (st.st_mtime_ns, st.st_size)
+                
+                cached = self._config_cache.get(config_path)
+                if cached is not None and cached[0] == version:
+                    return cached[1]
+                
+                if LOADS_BUFFERS and st.st_size > MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        config_data = json_loads(view)
+                else:
+                    config_data = json_loads(f.read())
             
+            self._config_cache[config_path] = (version, config_data)
             return config_data
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading config {name}: {str(e)}")
             return None
@@ -59,42 +112,56 @@ class ConfigManager:
         """
         config_path = os.path.join(self.config_dir, f"{name}.json")
         
-        if not os.path.exists(config_path):
-            return None
-        
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 return f.read()
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error reading config {name}: {str(e)}")
             return None
 
-    def save_config(self, name, config_data):
+    def save_config(self, name, config_data, compact=True):
         """
         Save a configuration.
         If config_data is a string, save it directly.
-        If config_data is a dict, convert to JSON and save.
+        If config_data is a dict, convert to JSON and save, indented
+        for hand editing only when compact is False.
         Returns True if successful, False otherwise.
         """
-        if not os.path.exists(self.config_dir):
-            os.makedirs(self.config_dir)
-            
         config_path = os.path.join(self.config_dir, f"{name}.json")
+        temp_path = config_path + ".tmp"
         
         try:
             if isinstance(config_data, dict):
-                # If it's a dict, convert to JSON string
-                config_text = json.dumps(config_data, indent=4)
+                # If it's a dict, convert to JSON bytes
+                payload = json_dumps(config_data, pretty=not compact)
             else:
                 # Otherwise assume it's already a string
-                config_text = config_data
+                payload = config_data.encode('utf-8')
                 
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(config_text)
+            try:
+                f = open(temp_path, 'wb')
+            except FileNotFoundError:
+                # Config directory was removed after start-up
+                os.makedirs(self.config_dir, exist_ok=True)
+                f = open(temp_path, 'wb')
+            
+            # Write a temporary file and swap it in, so a crash never leaves a truncated config
+            with f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, config_path)
+            self._config_cache.pop(config_path, None)
                 
             return True
         except Exception as e:
             print(f"Error saving config {name}: {str(e)}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
             return False
 
     def delete_config(self, name):
@@ -104,12 +171,13 @@ class ConfigManager:
         """
         config_path = os.path.join(self.config_dir, f"{name}.json")
         
-        if not os.path.exists(config_path):
-            return False
+        self._config_cache.pop(config_path, None)
         
         try:
             os.remove(config_path)
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error deleting config {name}: {str(e)}")
             return False
\ No newline at end of file
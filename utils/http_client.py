@@ -5,15 +5,252 @@ Provides functionality for making HTTP requests
 
 import time
 import re
+import functools
 import json
+import queue
+import random
 import requests
-from requests.exceptions import RequestException, Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import InvalidURL, RequestException, SSLError, Timeout
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 # Suppress insecure request warnings
 import urllib3
 urllib3.disable_warnings(InsecureRequestWarning)
 
+# Placeholder such as {USERNAME} or a captured variable name
+PLACEHOLDER_RE = re.compile(r'\{([^{}]+)\}')
+
+# HTTP methods a checker configuration may use
+SUPPORTED_METHODS = frozenset(('GET', 'POST', 'PUT', 'DELETE'))
+
+# Methods that send the configured form/JSON body
+BODY_METHODS = frozenset(('POST', 'PUT'))
+
+# Keep-alive connections per host for a pooled client; each is used by one thread at a time
+POOLED_CLIENT_CONNECTIONS = 2
+
+
+@functools.lru_cache(maxsize=256)
+def capture_pattern(start, end):
+    """
+    Get the compiled pattern matching text between two delimiters.
+    
+    :param start: Start delimiter
+    :param end: End delimiter
+    :return: Compiled regular expression
+    """
+    return re.compile(f'{re.escape(start)}(.*?){re.escape(end)}', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_template(text):
+    """
+    Convert text with {NAME} placeholders into a format string.
+    
+    Literal braces are escaped and each placeholder becomes an automatically
+    numbered field, so any placeholder name is safe to use.
+    
+    :param text: Text with placeholders
+    :return: Tuple of (format string, placeholder names in order)
+    """
+    parts = PLACEHOLDER_RE.split(text)
+    literals = [part.replace('{', '{{').replace('}', '}}') for part in parts[0::2]]
+    return '{}'.join(literals), tuple(parts[1::2])
+
+
+class Variables(dict):
+    """Placeholder values; unknown placeholders are left in the text as-is."""
+    
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+class HttpRequestError(Exception):
+    """Raised when a request fails after all retries."""
+
+
+def _empty_json():
+    """JSON getter for responses whose body is never parsed."""
+    return {}
+
+
+class CompiledConfig:
+    """
+    Checker configuration prepared once for repeated checks.
+    Holds pre-compiled capture patterns and pre-parsed conditions.
+    """
+
+    def __init__(self, config):
+        """
+        Compile a raw configuration.
+        
+        :param config: Configuration dictionary
+        """
+        self.raw = config
+        # Capture patterns, skipping incomplete entries
+        self.capture_patterns = []
+        for capture_config in config.get('capture', []):
+            name = capture_config.get('name', '')
+            start = capture_config.get('start', '')
+            end = capture_config.get('end', '')
+            if name and start and end:
+                self.capture_patterns.append((name, capture_pattern(start, end)))
+        
+        # Placeholder names that can ever be filled, in every supported case
+        self.variable_names = frozenset(['USERNAME', 'PASSWORD']).union(
+            variant
+            for name, pattern in self.capture_patterns
+            for variant in (name, name.upper(), name.lower())
+        )
+        
+        self.requests = []
+        for req_config in config.get('requests', []):
+            # Request fields are stored as render plans, see compile_field
+            self.requests.append({
+                'method': req_config.get('method', 'GET').upper(),
+                'url': self.compile_field(req_config.get('url', ''), str, self.variable_names),
+                'headers': self.compile_field(req_config.get('headers', {}), dict, self.variable_names),
+                'data': self.compile_field(req_config.get('data', {}), (dict, str), self.variable_names),
+                'json': self.compile_field(req_config.get('json', None), dict, self.variable_names),
+                'verify': req_config.get('verify', False)
+            })
+        
+        success_conditions = config.get('success_conditions', [])
+        failure_conditions = config.get('failure_conditions', [])
+        self.success_conditions = self.compile_conditions(success_conditions)
+        self.failure_conditions = self.compile_conditions(failure_conditions)
+        
+        # Only parse response JSON when a condition actually looks at it
+        self.needs_json = self.uses_json(success_conditions) or self.uses_json(failure_conditions)
+    
+    @classmethod
+    def from_raw(cls, config):
+        """
+        Build a compiled configuration, passing already compiled ones through.
+        
+        :param config: Configuration dictionary or CompiledConfig
+        :return: CompiledConfig instance
+        """
+        if isinstance(config, cls):
+            return config
+        return cls(config)
+    
+    @classmethod
+    def compile_field(cls, value, types=(str, dict, list), variable_names=None):
+        """
+        Compile a request field into a (kind, payload) render plan.
+        
+        Kinds are 'static' (used as-is), 'template' (compile_template result),
+        'dict' (list of key/value plans) and 'list' (list of item plans).
+        Strings whose placeholders can never be filled, and containers holding
+        only such strings, collapse into a single static plan, so they are
+        reused for every check instead of being walked and copied.
+        
+        :param value: Field value from the configuration
+        :param types: Types that take part in variable replacement
+        :param variable_names: Placeholder names that can be filled, or None for any
+        :return: Render plan tuple
+        """
+        if not isinstance(value, types):
+            return ('static', value)
+        
+        if isinstance(value, str):
+            if '{' in value:
+                names = PLACEHOLDER_RE.findall(value)
+                if names and (variable_names is None or not variable_names.isdisjoint(names)):
+                    return ('template', compile_template(value))
+            return ('static', value)
+        
+        if isinstance(value, dict):
+            items = [
+                (cls.compile_field(key, str, variable_names), cls.compile_field(item, variable_names=variable_names))
+                for key, item in value.items()
+            ]
+            if all(key[0] == 'static' and item[0] == 'static' for key, item in items):
+                return ('static', value)
+            return ('dict', items)
+        
+        # Lists replace variables in their strings and dictionaries only
+        items = [cls.compile_field(item, (str, dict), variable_names) for item in value]
+        if all(item[0] == 'static' for item in items):
+            return ('static', value)
+        return ('list', items)
+    
+    @classmethod
+    def compile_conditions(cls, conditions):
+        """
+        Compile conditions into predicates.
+        
+        Each predicate is called as predicate(text, status_code, get_json)
+        and returns whether the response matches its condition.
+        
+        :param conditions: List of condition dictionaries
+        :return: List of predicates
+        """
+        return [cls.compile_condition(condition) for condition in conditions or []]
+    
+    @staticmethod
+    def compile_condition(condition):
+        """
+        Compile a single condition into a predicate.
+        
+        :param condition: Condition dictionary
+        :return: Predicate function
+        """
+        condition_type = condition.get('type', '').lower()
+        condition_value = condition.get('value', '')
+        
+        if condition_type == 'contains':
+            return lambda text, status_code, get_json: condition_value in text
+        
+        if condition_type == 'not_contains':
+            return lambda text, status_code, get_json: condition_value not in text
+        
+        if condition_type == 'status_code':
+            try:
+                expected_code = int(condition_value)
+            except:
+                # An unparsable status code never matches
+                return lambda text, status_code, get_json: False
+            return lambda text, status_code, get_json: status_code == expected_code
+        
+        if condition_type == 'json_contains':
+            path_parts = tuple(part for part in condition.get('path', '').split('.') if part)
+            
+            def json_contains(text, status_code, get_json):
+                try:
+                    # Navigate the JSON path
+                    current = get_json()
+                    for part in path_parts:
+                        if isinstance(current, dict) and part in current:
+                            current = current[part]
+                        else:
+                            return False
+                    
+                    # Check if the final value contains the condition value
+                    if isinstance(current, str):
+                        return condition_value in current
+                    return condition_value in str(current)
+                except:
+                    return False
+            
+            return json_contains
+        
+        # Unknown condition types always match
+        return lambda text, status_code, get_json: True
+    
+    @staticmethod
+    def uses_json(conditions):
+        """
+        Check whether any of the conditions reads the response JSON.
+        
+        :param conditions: List of condition dictionaries
+        :return: True if a json_contains condition is present
+        """
+        return any(condition.get('type', '').lower() == 'json_contains' for condition in conditions or [])
+
 
 class HttpClient:
     """
@@ -21,12 +258,14 @@ class HttpClient:
     Includes functionality for parsing responses and checking conditions.
     """
 
-    def __init__(self, timeout=10, verify=False):
+    def __init__(self, timeout=10, verify=False, pool_size=10, pool_hosts=10):
         """
         Initialize the HTTP client.
         
         :param timeout: Request timeout in seconds
         :param verify: Whether to verify SSL certificates
+        :param pool_size: Number of keep-alive connections kept per host
+        :param pool_hosts: Number of hosts to keep connection pools for
         """
         self.timeout = timeout
         self.verify = verify
@@ -34,7 +273,20 @@ class HttpClient:
         self.proxies = None
         self.last_response = None
         self.retries = 3
-        self.retry_delay = 1
+        self.retry_base = 0.5
+        self.max_retry_delay = 30
+        
+        # Reuse TCP/TLS connections across requests; retries are handled in _request,
+        # and a full pool opens an extra connection instead of blocking the caller
+        adapter = HTTPAdapter(
+            pool_connections=pool_hosts,
+            pool_maxsize=pool_size,
+            pool_block=False,
+            max_retries=Retry(total=0, redirect=None)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Connection'] = 'keep-alive'
     
     def set_proxy(self, proxy_dict):
         """
@@ -68,30 +320,7 @@ class HttpClient:
         :param verify: Whether to verify SSL certificates (overrides instance setting)
         :return: Response object
         """
-        verify = self.verify if verify is None else verify
-        
-        for attempt in range(self.retries):
-            try:
-                response = self.session.get(
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    proxies=self.proxies,
-                    timeout=self.timeout,
-                    verify=verify
-                )
-                self.last_response = response
-                return response
-            except (RequestException, Timeout) as e:
-                if attempt == self.retries - 1:
-                    # Last attempt failed, return error response
-                    return {
-                        'status_code': 0,
-                        'text': str(e),
-                        'error': True,
-                        'error_message': str(e)
-                    }
-                time.sleep(self.retry_delay)
+        return self._safe_request('GET', url, headers=headers, params=params, verify=verify)
     
     def post(self, url, headers=None, data=None, json=None, verify=None):
         """
@@ -104,31 +333,7 @@ class HttpClient:
         :param verify: Whether to verify SSL certificates (overrides instance setting)
         :return: Response object
         """
-        verify = self.verify if verify is None else verify
-        
-        for attempt in range(self.retries):
-            try:
-                response = self.session.post(
-                    url=url,
-                    headers=headers,
-                    data=data,
-                    json=json,
-                    proxies=self.proxies,
-                    timeout=self.timeout,
-                    verify=verify
-                )
-                self.last_response = response
-                return response
-            except (RequestException, Timeout) as e:
-                if attempt == self.retries - 1:
-                    # Last attempt failed, return error response
-                    return {
-                        'status_code': 0,
-                        'text': str(e),
-                        'error': True,
-                        'error_message': str(e)
-                    }
-                time.sleep(self.retry_delay)
+        return self._safe_request('POST', url, headers=headers, data=data, json=json, verify=verify)
     
     def put(self, url, headers=None, data=None, json=None, verify=None):
         """
@@ -141,31 +346,7 @@ class HttpClient:
         :param verify: Whether to verify SSL certificates (overrides instance setting)
         :return: Response object
         """
-        verify = self.verify if verify is None else verify
-        
-        for attempt in range(self.retries):
-            try:
-                response = self.session.put(
-                    url=url,
-                    headers=headers,
-                    data=data,
-                    json=json,
-                    proxies=self.proxies,
-                    timeout=self.timeout,
-                    verify=verify
-                )
-                self.last_response = response
-                return response
-            except (RequestException, Timeout) as e:
-                if attempt == self.retries - 1:
-                    # Last attempt failed, return error response
-                    return {
-                        'status_code': 0,
-                        'text': str(e),
-                        'error': True,
-                        'error_message': str(e)
-                    }
-                time.sleep(self.retry_delay)
+        return self._safe_request('PUT', url, headers=headers, data=data, json=json, verify=verify)
     
     def delete(self, url, headers=None, verify=None):
         """
@@ -176,29 +357,72 @@ class HttpClient:
         :param verify: Whether to verify SSL certificates (overrides instance setting)
         :return: Response object
         """
+        return self._safe_request('DELETE', url, headers=headers, verify=verify)
+    
+    def _request(self, method, url, headers=None, data=None, json=None, params=None, verify=None):
+        """
+        Send a request through the session, retrying transient failures.
+        
+        Timeouts and connection errors are retried with exponential backoff
+        and jitter; any other request error is returned immediately.
+        
+        :param method: HTTP method
+        :param url: URL to request
+        :param headers: Headers to include in the request
+        :param data: Form data to include in the request
+        :param json: JSON data to include in the request
+        :param params: Query parameters
+        :param verify: Whether to verify SSL certificates (overrides instance setting)
+        :return: Response object
+        :raises HttpRequestError: If the request failed
+        """
         verify = self.verify if verify is None else verify
         
         for attempt in range(self.retries):
             try:
-                response = self.session.delete(
-                    url=url,
+                response = self.session.request(
+                    method,
+                    url,
                     headers=headers,
+                    data=data,
+                    json=json,
+                    params=params,
                     proxies=self.proxies,
                     timeout=self.timeout,
                     verify=verify
                 )
                 self.last_response = response
                 return response
-            except (RequestException, Timeout) as e:
+            except (SSLError, InvalidURL) as e:
+                # Retrying will not fix a bad certificate or URL
+                raise HttpRequestError(str(e)) from e
+            except (Timeout, requests.ConnectionError) as e:
                 if attempt == self.retries - 1:
-                    # Last attempt failed, return error response
-                    return {
-                        'status_code': 0,
-                        'text': str(e),
-                        'error': True,
-                        'error_message': str(e)
-                    }
-                time.sleep(self.retry_delay)
+                    # Last attempt failed
+                    raise HttpRequestError(str(e)) from e
+                delay = min(self.max_retry_delay, self.retry_base * (2 ** attempt))
+                time.sleep(delay * random.uniform(0.5, 1.0))
+            except RequestException as e:
+                raise HttpRequestError(str(e)) from e
+    
+    def _safe_request(self, method, url, **kwargs):
+        """
+        Send a request, turning a failure into an error response.
+        
+        :param method: HTTP method
+        :param url: URL to request
+        :param kwargs: Arguments passed to _request
+        :return: Response object or error response dictionary
+        """
+        try:
+            return self._request(method, url, **kwargs)
+        except HttpRequestError as e:
+            return {
+                'status_code': 0,
+                'text': str(e),
+                'error': True,
+                'error_message': str(e)
+            }
     
     def extract_substring(self, text, start, end):
         """
@@ -213,8 +437,7 @@ class HttpClient:
             return None
         
         try:
-            pattern = f'{re.escape(start)}(.*?){re.escape(end)}'
-            match = re.search(pattern, text, re.DOTALL)
+            match = capture_pattern(start, end).search(text)
             if match:
                 return match.group(1).strip()
             return None
@@ -227,9 +450,11 @@ class HttpClient:
         
         :param username: Account username
         :param password: Account password
-        :param config: Configuration dictionary
+        :param config: Configuration dictionary or CompiledConfig
         :return: Dictionary with check results
         """
+        config = CompiledConfig.from_raw(config)
+        
         result = {
             'success': False,
             'failure': False,
@@ -243,78 +468,63 @@ class HttpClient:
             captured_data = {}
             
             # Process each request in the configuration
-            for i, req_config in enumerate(config.get('requests', [])):
-                method = req_config.get('method', 'GET').upper()
-                url = req_config.get('url', '')
-                headers = req_config.get('headers', {})
-                data = req_config.get('data', {})
-                json_data = req_config.get('json', None)
-                verify = req_config.get('verify', False)
+            last_index = len(config.requests) - 1
+            for i, req_config in enumerate(config.requests):
+                method = req_config['method']
+                verify = req_config['verify']
                 
                 # Prepare request data
-                url = self._replace_variables(url, username, password, captured_data)
-                headers = self._prepare_request_data(headers, username, password, captured_data)
-                
-                if isinstance(data, dict):
-                    data = self._prepare_request_data(data, username, password, captured_data)
-                elif isinstance(data, str):
-                    data = self._replace_variables(data, username, password, captured_data)
-                
-                if isinstance(json_data, dict):
-                    json_data = self._prepare_request_data(json_data, username, password, captured_data)
+                variables = self._variables(username, password, captured_data)
+                url = self._render(req_config['url'], variables)
+                headers = self._render(req_config['headers'], variables)
+                data = self._render(req_config['data'], variables)
+                json_data = self._render(req_config['json'], variables)
                 
-                # Make the request based on the method
-                if method == 'GET':
-                    response = self.get(url, headers=headers, verify=verify)
-                elif method == 'POST':
-                    response = self.post(url, headers=headers, data=data, json=json_data, verify=verify)
-                elif method == 'PUT':
-                    response = self.put(url, headers=headers, data=data, json=json_data, verify=verify)
-                elif method == 'DELETE':
-                    response = self.delete(url, headers=headers, verify=verify)
-                else:
+                if method not in SUPPORTED_METHODS:
                     result['error'] = True
                     result['error_message'] = f"Unsupported HTTP method: {method}"
                     return result
                 
-                # Check if the response is an error
-                if hasattr(response, 'get') and response.get('error', False):
+                # GET and DELETE requests never carried a body
+                if method not in BODY_METHODS:
+                    data = json_data = None
+                
+                try:
+                    response = self._request(method, url, headers=headers, data=data, json=json_data, verify=verify)
+                except HttpRequestError as e:
                     result['error'] = True
-                    result['error_message'] = response.get('error_message', 'Unknown error')
+                    result['error_message'] = str(e)
                     return result
                 
-                # Get response text
-                if hasattr(response, 'text'):
-                    response_text = response.text
-                else:
-                    response_text = str(response)
+                # Only the final request is captured from and checked
+                if i != last_index:
+                    continue
+                
+                response_text = response.text
                 
                 # Extract captured data if defined in the config
-                if i == len(config.get('requests', [])) - 1:  # Only capture from final request
-                    for capture_config in config.get('capture', []):
-                        name = capture_config.get('name', '')
-                        start = capture_config.get('start', '')
-                        end = capture_config.get('end', '')
-                        
-                        if name and start and end:
-                            try:
-                                captured_value = self.extract_substring(response_text, start, end)
-                                if captured_value:
-                                    captured_data[name] = captured_value
-                                    result['captured_data'][name] = captured_value
-                            except Exception as e:
-                                # Capture error but continue process
-                                print(f"Error capturing data {name}: {str(e)}")
+                for name, pattern in config.capture_patterns:
+                    try:
+                        match = pattern.search(response_text) if response_text else None
+                        captured_value = match.group(1).strip() if match else None
+                        if captured_value:
+                            captured_data[name] = captured_value
+                            result['captured_data'][name] = captured_value
+                    except Exception as e:
+                        # Capture error but continue process
+                        print(f"Error capturing data {name}: {str(e)}")
                 
-                # Check success and failure conditions on the final request
-                if i == len(config.get('requests', [])) - 1:
+                # Check success and failure conditions, reading the response only once
+                if config.success_conditions or config.failure_conditions:
+                    properties = self._response_properties(response, config.needs_json)
+                    
                     # Check success conditions
-                    if config.get('success_conditions'):
-                        result['success'] = self._check_conditions(response, config.get('success_conditions', []))
+                    if config.success_conditions:
+                        result['success'] = self._match_conditions(properties, config.success_conditions)
                     
                     # Check failure conditions
-                    if config.get('failure_conditions'):
-                        result['failure'] = self._check_conditions(response, config.get('failure_conditions', []))
+                    if config.failure_conditions:
+                        result['failure'] = self._match_conditions(properties, config.failure_conditions)
             
             return result
             
@@ -323,6 +533,44 @@ class HttpClient:
             result['error_message'] = str(e)
             return result
     
+    def _render(self, plan, variables):
+        """
+        Build a request field from a render plan.
+        
+        :param plan: Render plan from CompiledConfig.compile_field
+        :param variables: Placeholder values from _variables
+        :return: Prepared field value
+        """
+        kind, payload = plan
+        if kind == 'static':
+            return payload
+        if kind == 'template':
+            template, names = payload
+            return template.format(*[variables[name] for name in names])
+        if kind == 'dict':
+            return {self._render(key, variables): self._render(item, variables) for key, item in payload}
+        return [self._render(item, variables) for item in payload]
+    
+    def _variables(self, username, password, captured_data=None):
+        """
+        Collect the placeholder values for a check.
+        
+        :param username: Account username
+        :param password: Account password
+        :param captured_data: Dictionary with captured data from previous requests
+        :return: Variables mapping of placeholder names to values
+        """
+        variables = Variables(USERNAME=username, PASSWORD=password)
+        
+        # Captured variables support {VARIABLE}, {variable} and {Variable} formats
+        if captured_data:
+            for name, value in captured_data.items():
+                variables.setdefault(name.upper(), value)
+                variables.setdefault(name.lower(), value)
+                variables.setdefault(name, value)
+        
+        return variables
+    
     def _prepare_request_data(self, req_data, username, password, captured_data=None):
         """
         Prepare request data by replacing variables.
@@ -379,18 +627,14 @@ class HttpClient:
         if not isinstance(text, str):
             return text
         
-        # Replace username and password
-        result = text.replace('{USERNAME}', username).replace('{PASSWORD}', password)
-        
-        # Replace captured variables if present
-        if captured_data:
-            for name, value in captured_data.items():
-                # Support for {VARIABLE}, {variable} and {Variable} formats
-                result = result.replace(f'{{{name.upper()}}}', value)
-                result = result.replace(f'{{{name.lower()}}}', value)
-                result = result.replace(f'{{{name}}}', value)
+        # Most header values and URLs carry no placeholders at all
+        if '{' not in text:
+            return text
         
-        return result
+        # Substitute every placeholder in a single formatting pass
+        variables = self._variables(username, password, captured_data)
+        template, names = compile_template(text)
+        return template.format(*[variables[name] for name in names])
     
     def _check_conditions(self, response, conditions):
         """
@@ -403,63 +647,92 @@ class HttpClient:
         if not conditions:
             return False
         
-        # Get response properties
-        if hasattr(response, 'text'):
-            response_text = response.text
-            status_code = response.status_code
-            try:
-                json_data = response.json()
-            except:
-                json_data = {}
+        if isinstance(response, dict):
+            # Error response from a failed request
+            properties = (response.get('text', ''), response.get('status_code', 0), _empty_json)
         else:
-            # Fallback for custom error response
-            response_text = response.get('text', '')
-            status_code = response.get('status_code', 0)
-            json_data = {}
+            properties = self._response_properties(response, CompiledConfig.uses_json(conditions))
+        return self._match_conditions(properties, CompiledConfig.compile_conditions(conditions))
+    
+    def _response_properties(self, response, needs_json=True):
+        """
+        Get the text, status code and JSON body of a response.
         
-        # Check each condition
-        for condition in conditions:
-            condition_type = condition.get('type', '').lower()
-            condition_value = condition.get('value', '')
-            
-            if condition_type == 'contains':
-                # Check if the response contains the value
-                if condition_value not in response_text:
-                    return False
-            elif condition_type == 'not_contains':
-                # Check if the response does not contain the value
-                if condition_value in response_text:
-                    return False
-            elif condition_type == 'status_code':
-                # Check if the response status code matches
-                try:
-                    expected_code = int(condition_value)
-                    if status_code != expected_code:
-                        return False
-                except:
-                    return False
-            elif condition_type == 'json_contains':
-                # Check if the response JSON contains the value
+        The JSON body is returned as a getter that parses the body on first
+        use, so conditions that fail before reaching it never parse it.
+        
+        :param response: Response object
+        :param needs_json: Whether the JSON body may be needed
+        :return: Tuple of (text, status code, JSON getter)
+        """
+        if not needs_json:
+            return response.text, response.status_code, _empty_json
+        
+        json_data = None
+        
+        def get_json():
+            nonlocal json_data
+            if json_data is None:
                 try:
-                    json_path = condition.get('path', '')
-                    
-                    # Navigate the JSON path
-                    path_parts = json_path.split('.')
-                    current = json_data
-                    for part in path_parts:
-                        if part:
-                            if isinstance(current, dict) and part in current:
-                                current = current[part]
-                            else:
-                                return False
-                    
-                    # Check if the final value contains the condition value
-                    if isinstance(current, str) and condition_value not in current:
-                        return False
-                    elif not isinstance(current, str) and condition_value not in str(current):
-                        return False
+                    json_data = response.json()
                 except:
-                    return False
+                    json_data = {}
+            return json_data
+        
+        return response.text, response.status_code, get_json
+    
+    def _match_conditions(self, properties, conditions):
+        """
+        Check compiled conditions against response properties.
+        
+        :param properties: Tuple from _response_properties
+        :param conditions: List of predicates from CompiledConfig.compile_conditions
+        :return: True if all conditions match, False otherwise
+        """
+        if not conditions:
+            return False
+        
+        response_text, status_code, get_json = properties
+        
+        # Check each condition
+        for predicate in conditions:
+            if not predicate(response_text, status_code, get_json):
+                return False
         
         # All conditions matched
-        return True
\ No newline at end of file
+        return True
+
+
+class HttpClientPool:
+    """
+    Pool of reusable HTTP clients.
+    Keeps sessions (and their open connections) alive across checks.
+    """
+
+    def __init__(self, size, timeout=10, verify=False):
+        """
+        Initialize the pool with pre-allocated clients.
+        
+        :param size: Number of clients to create
+        :param timeout: Request timeout in seconds
+        :param verify: Whether to verify SSL certificates
+        """
+        self._clients = queue.SimpleQueue()
+        for _ in range(size):
+            self._clients.put(HttpClient(timeout=timeout, verify=verify, pool_size=POOLED_CLIENT_CONNECTIONS))
+    
+    def get(self):
+        """
+        Take a client out of the pool, waiting until one is free.
+        
+        :return: HttpClient instance
+        """
+        return self._clients.get()
+    
+    def put(self, client):
+        """
+        Return a client to the pool.
+        
+        :param client: HttpClient instance taken with get()
+        """
+        self._clients.put(client)
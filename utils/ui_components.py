@@ -3,6 +3,11 @@ UI Components
 Custom UI components for the CyberChecker application
 """
 
+import os
+import functools
+import weakref
+from collections import deque
+
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.spinner import Spinner
@@ -11,7 +16,106 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.dropdown import DropDown
 from kivy.uix.progressbar import ProgressBar
-from kivy.graphics import Color, Rectangle
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.properties import StringProperty, ListProperty, BooleanProperty
+from kivy.graphics import Color, Rectangle, InstructionGroup
+from kivy.clock import Clock
+
+# Seconds between appending buffered results to a ResultsPanel
+RESULTS_FLUSH_INTERVAL = 1 / 30.
+
+# Default number of result lines a ResultsPanel keeps
+RESULTS_MAX_LINES = 2000
+
+
+def pressed_color(color):
+    """Darkened version of a background color, shown while pressed."""
+    r, g, b, a = color
+    return max(0, r - 0.1), max(0, g - 0.1), max(0, b - 0.1), a
+
+
+# Widgets whose graphics must be updated on the next frame
+_dirty_widgets = set()
+
+
+def _flush_graphics(dt):
+    """Apply the pending graphics updates, once per widget."""
+    widgets = list(_dirty_widgets)
+    _dirty_widgets.clear()
+    for widget in widgets:
+        widget._apply_graphics()
+
+
+# Coalesces every pos/size change within a frame into one flush
+_graphics_trigger = Clock.create_trigger(_flush_graphics)
+
+
+def schedule_graphics(widget):
+    """Update a widget's graphics on the next frame."""
+    _dirty_widgets.add(widget)
+    _graphics_trigger()
+
+
+# Background instructions of discarded widgets, by color, for reuse
+_background_pool = {}
+
+# Most pooled backgrounds kept per color
+BACKGROUND_POOL_SIZE = 8
+
+
+def _release_background(canvas, rgba, background):
+    """Return a discarded widget's background to the pool on the main thread."""
+    def release(dt):
+        canvas.remove(background[0])
+        free = _background_pool.setdefault(rgba, [])
+        if len(free) < BACKGROUND_POOL_SIZE:
+            free.append(background)
+    
+    # Finalizers can run on whichever thread triggered garbage collection
+    Clock.schedule_once(release)
+
+
+class BackgroundMixin:
+    """
+    Mixin drawing a solid background behind a widget.
+    """
+    def install_background(self, rgba):
+        """Draw the background and keep it matched to the widget."""
+        rgba = tuple(rgba)
+        free = _background_pool.get(rgba)
+        if free:
+            # Reuse the instructions of a discarded widget with the same color
+            group, self.rect = free.pop()
+            self.rect.pos = self.pos
+            self.rect.size = self.size
+        else:
+            group = InstructionGroup()
+            group.add(Color(*rgba))
+            self.rect = Rectangle(pos=self.pos, size=self.size)
+            group.add(self.rect)
+        self.canvas.before.add(group)
+        weakref.finalize(self, _release_background, self.canvas.before, rgba, (group, self.rect))
+        
+        # Position and size last applied to the graphics, to skip repeated updates
+        self._last_rect = (None, None)
+        
+        # Update background when the widget changes
+        self.fbind('pos', self.update_rect)
+        self.fbind('size', self.update_rect)
+    
+    def update_rect(self, *args):
+        """Schedule a background update for the next frame."""
+        schedule_graphics(self)
+    
+    def _apply_graphics(self):
+        """Update background rectangle."""
+        rect = (tuple(self.pos), tuple(self.size))
+        if rect == self._last_rect:
+            return
+        self._last_rect = rect
+        self.rect.pos = self.pos
+        self.rect.size = self.size
 
 
 class ModernLabel(Label):
@@ -24,6 +128,9 @@ class ModernLabel(Label):
         self.halign = kwargs.pop('halign', 'center')
         self.valign = kwargs.pop('valign', 'middle')
         
+        # Short single-line labels can skip text wrapping altogether
+        wrap = kwargs.pop('wrap', True)
+        
         # Make sure there's a color
         if 'color' not in kwargs:
             kwargs['color'] = (0.9, 0.9, 0.9, 1)
@@ -31,7 +138,8 @@ class ModernLabel(Label):
         super(ModernLabel, self).__init__(**kwargs)
         
         # Update text properties
-        self.bind(size=self.update_text_size)
+        if wrap:
+            self.fbind('size', self.update_text_size)
         
     def update_text_size(self, *args):
         """Update text size when size changes."""
@@ -55,21 +163,27 @@ class ModernButton(Button):
         if 'color' not in kwargs:
             kwargs['color'] = (0.9, 0.9, 0.9, 1)
         
+        # Normal and pressed colors, computed once
+        self._normal_bg = tuple(kwargs['background_color'])
+        self._pressed_bg = pressed_color(self._normal_bg)
+        
         super(ModernButton, self).__init__(**kwargs)
         
         # Add highlight on hover
-        self.bind(state=self.update_background)
+        self.fbind('state', self.update_background)
         
     def update_background(self, instance, value):
         """Update background color based on state."""
         if value == 'down':
-            # Darken the button when pressed
-            r, g, b, a = self.background_color
-            self.background_color = max(0, r - 0.1), max(0, g - 0.1), max(0, b - 0.1), a
+            # Darken the button when pressed, following any color set since
+            normal = tuple(self.background_color)
+            if normal != self._normal_bg:
+                self._normal_bg = normal
+                self._pressed_bg = pressed_color(normal)
+            self.background_color = self._pressed_bg
         else:
             # Restore original color
-            # Note: This assumes the original color is stored somehow or recalculated
-            pass
+            self.background_color = self._normal_bg
 
 
 class GradientButton(Button):
@@ -104,19 +218,18 @@ class GradientButton(Button):
         if 'color' not in kwargs:
             kwargs['color'] = (0.9, 0.9, 0.9, 1)
         
+        # Start and end colors of the gradient, used when normal and pressed
+        self._normal_color = tuple(gradient_colors[0])
+        self._pressed_color = tuple(gradient_colors[1])
+        
         super(GradientButton, self).__init__(**kwargs)
         
         # Add highlight on hover
-        self.bind(state=self.update_background)
+        self.fbind('state', self.update_background)
         
     def update_background(self, instance, value):
         """Update background color based on state."""
-        if value == 'down':
-            # Use the end color of the gradient when pressed
-            self.background_color = self.gradient_colors[1]
-        else:
-            # Use the start color of the gradient when normal
-            self.background_color = self.gradient_colors[0]
+        self.background_color = self._pressed_color if value == 'down' else self._normal_color
 
 
 class ModernTextInput(TextInput):
@@ -146,18 +259,30 @@ class ModernTextInput(TextInput):
                 size=(self.size[0] - 2, self.size[1] - 2)
             )
         
+        # Position and size last applied to the graphics, to skip repeated updates
+        self._last_rect = (None, None)
+        
         # Update border position and size when widget changes
-        self.bind(pos=self.update_graphics, size=self.update_graphics)
+        self.fbind('pos', self.update_graphics)
+        self.fbind('size', self.update_graphics)
     
     def update_graphics(self, *args):
+        """Schedule a graphics update for the next frame."""
+        schedule_graphics(self)
+    
+    def _apply_graphics(self):
         """Update border and interior graphics."""
+        rect = (tuple(self.pos), tuple(self.size))
+        if rect == self._last_rect:
+            return
+        self._last_rect = rect
         self.border.pos = self.pos
         self.border.size = self.size
         self.interior.pos = (self.pos[0] + 1, self.pos[1] + 1)
         self.interior.size = (self.size[0] - 2, self.size[1] - 2)
 
 
-class ModernDropDown(DropDown):
+class ModernDropDown(BackgroundMixin, DropDown):
     """
     Custom dropdown with modern styling.
     """
@@ -171,17 +296,7 @@ class ModernDropDown(DropDown):
         super(ModernDropDown, self).__init__(**kwargs)
         
         # Add background
-        with self.canvas.before:
-            Color(*self.background_color)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-        
-        # Update background when dropdown changes
-        self.bind(pos=self.update_rect, size=self.update_rect)
-    
-    def update_rect(self, *args):
-        """Update background rectangle."""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
+        self.install_background(self.background_color)
 
 
 class ModernSpinner(Spinner):
@@ -201,50 +316,54 @@ class ModernSpinner(Spinner):
         if 'color' not in kwargs:
             kwargs['color'] = (0.9, 0.9, 0.9, 1)
             
-        # Create a custom dropdown
-        dropdown = ModernDropDown(background_color=kwargs['background_color'])
-        kwargs['dropdown_cls'] = dropdown
+        # Custom dropdown; Spinner expects a class (or factory) it can call itself
+        kwargs['dropdown_cls'] = functools.partial(ModernDropDown, background_color=kwargs['background_color'])
+        
+        # Normal and pressed colors, computed once
+        self._normal_bg = tuple(kwargs['background_color'])
+        self._pressed_bg = pressed_color(self._normal_bg)
         
         super(ModernSpinner, self).__init__(**kwargs)
         
         # Add highlight on hover
-        self.bind(state=self.update_background)
+        self.fbind('state', self.update_background)
         
     def update_background(self, instance, value):
         """Update background color based on state."""
         if value == 'down':
-            # Darken the button when pressed
-            r, g, b, a = self.background_color
-            self.background_color = max(0, r - 0.1), max(0, g - 0.1), max(0, b - 0.1), a
+            # Darken the button when pressed, following any color set since
+            normal = tuple(self.background_color)
+            if normal != self._normal_bg:
+                self._normal_bg = normal
+                self._pressed_bg = pressed_color(normal)
+            self.background_color = self._pressed_bg
         else:
             # Restore original color
-            # Note: This assumes the original color is stored somehow or recalculated
-            pass
+            self.background_color = self._normal_bg
     
-    def _build_dropdown(self, *largs):
+    def _update_dropdown(self, *largs):
         """Override to customize dropdown items."""
-        super(ModernSpinner, self)._build_dropdown(*largs)
-        
-        # Customize dropdown items
-        for item in self.dropdown.children:
-            if isinstance(item, Button):
-                item.background_normal = ''
-                item.background_down = ''
-                item.background_color = self.background_color
-                item.color = self.color
-                
-                # Add highlight on hover
-                item.bind(state=self.update_item_background)
+        super(ModernSpinner, self)._update_dropdown(*largs)
+        
+        # Customize dropdown items; the container only holds the option
+        # buttons the spinner just created
+        for item in self._dropdown.container.children:
+            item.background_normal = ''
+            item.background_down = ''
+            item.background_color = self._normal_bg
+            item.color = self.color
+            
+            # Add highlight on hover
+            item.fbind('state', self.update_item_background)
     
     def update_item_background(self, instance, value):
         """Update dropdown item background color based on state."""
         if value == 'down':
             # Darken the button when pressed
-            r, g, b, a = self.background_color
-            instance.background_color = max(0, r - 0.1), max(0, g - 0.1), max(0, b - 0.1), a
+            instance.background_color = self._pressed_bg
         else:
             # Restore original color
-            instance.background_color = self.background_color
+            instance.background_color = self._normal_bg
 
 
 class ModernProgressBar(ProgressBar):
@@ -252,49 +371,81 @@ class ModernProgressBar(ProgressBar):
     Custom progress bar with modern styling.
     """
     def __init__(self, **kwargs):
+        # Pixel width of the progress rectangle, to skip sub-pixel value updates
+        self._last_px = -1
+        
         # Default properties
         super(ModernProgressBar, self).__init__(**kwargs)
         
-        self.bind(pos=self.update_graphics, size=self.update_graphics)
+        # The default style's bar images would only be painted over, so drop them
+        self.canvas.clear()
         
-        with self.canvas:
+        # Instructions are created once and only resized afterwards
+        with self.canvas.before:
             # Background
-            Color(0.1, 0.1, 0.1, 1)
+            self._bg_color = Color(0.1, 0.1, 0.1, 1)
             self.background_rect = Rectangle(pos=self.pos, size=self.size)
             
             # Progress
-            Color(0.2, 0.7, 0.2, 1)
+            self._fg_color = Color(0.2, 0.7, 0.2, 1)
             self.progress_rect = Rectangle(
                 pos=self.pos,
-                size=(self.width * (self.value / self.max), self.height)
+                size=(self.progress_width(self.value), self.height)
             )
+        
+        # Position and size last applied to the graphics, to skip repeated updates
+        self._last_rect = (None, None)
+        self.fbind('pos', self.update_graphics)
+        self.fbind('size', self.update_graphics)
     
     def update_graphics(self, *args):
+        """Schedule a graphics update for the next frame."""
+        schedule_graphics(self)
+    
+    def _apply_graphics(self):
         """Update graphics based on progress."""
-        self.canvas.clear()
-        
-        with self.canvas:
-            # Background
-            Color(0.1, 0.1, 0.1, 1)
-            self.background_rect = Rectangle(pos=self.pos, size=self.size)
-            
-            # Progress
-            Color(0.2, 0.7, 0.2, 1)
-            self.progress_rect = Rectangle(
-                pos=self.pos,
-                size=(self.width * (self.value / self.max), self.height)
-            )
+        rect = (tuple(self.pos), tuple(self.size))
+        if rect == self._last_rect:
+            return
+        self._last_rect = rect
+        self.background_rect.pos = self.pos
+        self.background_rect.size = self.size
+        self.progress_rect.pos = self.pos
+        self._last_px = self.progress_width(self.value)
+        self.progress_rect.size = (self._last_px, self.height)
+    
+    def progress_width(self, value):
+        """Width of the progress rectangle in whole pixels for the given value."""
+        if not self.max:
+            return 0
+        return int(self.width * (value / self.max))
     
     def on_value(self, instance, value):
         """Update progress rectangle when value changes."""
-        self.progress_rect.size = (self.width * (value / self.max), self.height)
+        px = self.progress_width(value)
+        if px == self._last_px:
+            return
+        self._last_px = px
+        self.progress_rect.size = (px, self.height)
+
+
+class ResultRow(ModernLabel):
+    """
+    Single line of a ResultsPanel.
+    """
+    def __init__(self, **kwargs):
+        kwargs.setdefault('halign', 'left')
+        super(ResultRow, self).__init__(**kwargs)
 
 
-class ResultsPanel(BoxLayout):
+class ResultsPanel(BackgroundMixin, BoxLayout):
     """
     Panel for displaying results (hits, free, etc.)
     """
     def __init__(self, title="Results", **kwargs):
+        # Only the most recent lines are kept on screen
+        max_lines = kwargs.pop('max_lines', RESULTS_MAX_LINES)
+        
         # Default properties
         super(ResultsPanel, self).__init__(**kwargs)
         
@@ -302,13 +453,21 @@ class ResultsPanel(BoxLayout):
         self.padding = 5
         self.spacing = 5
         
-        # Add a background
-        with self.canvas.before:
-            Color(0.15, 0.15, 0.15, 1)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
+        # Rows waiting to be appended on the next flush
+        self._buffer = deque()
+        self._flush_scheduled = False
+        
+        # Previous result, its repeat count and row, for collapsing repeats
+        self._last_text = None
+        self._last_count = 0
+        self._last_row = None
+        self._rows_changed = False
         
-        # Update background when panel changes
-        self.bind(pos=self.update_rect, size=self.update_rect)
+        # Rows currently shown, as RecycleView data
+        self._lines = deque(maxlen=max_lines)
+        
+        # Add a background
+        self.install_background((0.15, 0.15, 0.15, 1))
         
         # Add a title
         self.title_label = ModernLabel(
@@ -319,29 +478,65 @@ class ResultsPanel(BoxLayout):
         )
         self.add_widget(self.title_label)
         
-        # Add a text input for the results
-        self.results = ModernTextInput(
-            readonly=True,
-            multiline=True,
-            size_hint=(1, 0.9)
+        # Add a recycled list for the results; only visible rows become widgets
+        self.results = RecycleView(size_hint=(1, 0.9))
+        self.results.viewclass = ResultRow
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, 24),
+            default_size_hint=(1, None),
+            size_hint_y=None
         )
+        layout.fbind('minimum_height', layout.setter('height'))
+        self.results.add_widget(layout)
         self.add_widget(self.results)
     
-    def update_rect(self, *args):
-        """Update background rectangle."""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-    
     def add_result(self, text):
         """Add a result to the panel."""
-        self.results.text += text + '\n'
+        if text == self._last_text:
+            # Collapse repeats of the previous result into a counter on its row
+            self._last_count += 1
+            self._last_row['text'] = f"{text} (x{self._last_count})"
+            self._rows_changed = True
+        else:
+            self._last_text = text
+            self._last_count = 1
+            self._last_row = {'text': text}
+            self._buffer.append(self._last_row)
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            Clock.schedule_once(self._flush, RESULTS_FLUSH_INTERVAL)
+    
+    def _flush(self, dt):
+        """Append buffered results to the list in one go."""
+        self._flush_scheduled = False
+        if self._buffer:
+            self._lines.extend(self._buffer)
+            self._buffer.clear()
+            self._show_lines()
+        elif self._rows_changed:
+            self.results.refresh_from_data()
+        self._rows_changed = False
+    
+    def _show_lines(self):
+        """Show the retained lines."""
+        self.results.data = list(self._lines)
+    
+    def set_max_lines(self, max_lines):
+        """Change how many of the most recent lines are kept."""
+        self._lines = deque(self._lines, maxlen=max_lines)
+        self._show_lines()
     
     def clear(self):
         """Clear all results."""
-        self.results.text = ''
+        self._buffer.clear()
+        self._lines.clear()
+        self._last_text = None
+        self.results.data = []
 
 
-class StatsPanel(BoxLayout):
+class StatsPanel(BackgroundMixin, GridLayout):
     """
     Panel for displaying statistics (CPM, hits, etc.)
     """
@@ -349,70 +544,187 @@ class StatsPanel(BoxLayout):
         # Default properties
         super(StatsPanel, self).__init__(**kwargs)
         
-        self.orientation = 'horizontal'
+        self.cols = 4
+        self.rows = 2
         self.padding = 5
-        self.spacing = 10
+        self.spacing = (10, 0)
         
-        # Add a background
-        with self.canvas.before:
-            Color(0.15, 0.15, 0.15, 1)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
+        # Label texts waiting for the next frame, by label attribute name
+        self._pending = {}
+        self._scheduled = False
         
-        # Update background when panel changes
-        self.bind(pos=self.update_rect, size=self.update_rect)
+        # Last (checked, total) passed to update_progress
+        self._last_progress = (-1, -1)
         
-        # Add stats labels
+        # Add a background
+        self.install_background((0.15, 0.15, 0.15, 1))
+        
+        # Add stats labels; captions fill the first row, values the second
         # CPM (Checks Per Minute)
-        self.cpm_box = BoxLayout(orientation='vertical', size_hint=(0.25, 1))
-        self.cpm_label = ModernLabel(text="CPM:", size_hint=(1, 0.4))
-        self.cpm_value = ModernLabel(text="0", size_hint=(1, 0.6), font_size=18)
-        self.cpm_box.add_widget(self.cpm_label)
-        self.cpm_box.add_widget(self.cpm_value)
+        self.cpm_label = ModernLabel(text="CPM:", size_hint=(0.25, 0.4))
+        self.cpm_value = ModernLabel(text="0", size_hint=(0.25, 0.6), font_size=18, wrap=False)
         
         # Hits
-        self.hits_box = BoxLayout(orientation='vertical', size_hint=(0.25, 1))
-        self.hits_label = ModernLabel(text="Hits:", size_hint=(1, 0.4))
-        self.hits_value = ModernLabel(text="0", size_hint=(1, 0.6), font_size=18)
-        self.hits_box.add_widget(self.hits_label)
-        self.hits_box.add_widget(self.hits_value)
+        self.hits_label = ModernLabel(text="Hits:", size_hint=(0.25, 0.4))
+        self.hits_value = ModernLabel(text="0", size_hint=(0.25, 0.6), font_size=18, wrap=False)
         
         # Checked / Total
-        self.progress_box = BoxLayout(orientation='vertical', size_hint=(0.25, 1))
-        self.progress_label = ModernLabel(text="Progress:", size_hint=(1, 0.4))
-        self.progress_value = ModernLabel(text="0/0", size_hint=(1, 0.6), font_size=18)
-        self.progress_box.add_widget(self.progress_label)
-        self.progress_box.add_widget(self.progress_value)
+        self.progress_label = ModernLabel(text="Progress:", size_hint=(0.25, 0.4))
+        self.progress_value = ModernLabel(text="0/0", size_hint=(0.25, 0.6), font_size=18, wrap=False)
         
         # Elapsed time
-        self.time_box = BoxLayout(orientation='vertical', size_hint=(0.25, 1))
-        self.time_label = ModernLabel(text="Elapsed:", size_hint=(1, 0.4))
-        self.time_value = ModernLabel(text="00:00:00", size_hint=(1, 0.6), font_size=18)
-        self.time_box.add_widget(self.time_label)
-        self.time_box.add_widget(self.time_value)
-        
-        # Add all boxes to the panel
-        self.add_widget(self.cpm_box)
-        self.add_widget(self.hits_box)
-        self.add_widget(self.progress_box)
-        self.add_widget(self.time_box)
-    
-    def update_rect(self, *args):
-        """Update background rectangle."""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
+        self.time_label = ModernLabel(text="Elapsed:", size_hint=(0.25, 0.4))
+        self.time_value = ModernLabel(text="00:00:00", size_hint=(0.25, 0.6), font_size=18, wrap=False)
+        
+        # Add all labels to the grid
+        for label in (self.cpm_label, self.hits_label, self.progress_label, self.time_label,
+                      self.cpm_value, self.hits_value, self.progress_value, self.time_value):
+            self.add_widget(label)
     
     def update_cpm(self, value):
         """Update CPM value."""
-        self.cpm_value.text = str(value)
+        self._set_text('cpm_value', str(value))
     
     def update_hits(self, value):
         """Update hits value."""
-        self.hits_value.text = str(value)
+        self._set_text('hits_value', str(value))
     
     def update_progress(self, checked, total):
         """Update progress value."""
-        self.progress_value.text = f"{checked}/{total}"
+        progress = (checked, total)
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+        self._set_text('progress_value', '%d/%d' % progress)
     
     def update_time(self, time_str):
         """Update elapsed time value."""
-        self.time_value.text = time_str
\ No newline at end of file
+        self._set_text('time_value', time_str)
+    
+    def _set_text(self, name, text):
+        """Queue a label text, ignoring values that are already shown or queued."""
+        if self._pending.get(name, getattr(self, name).text) == text:
+            return
+        self._pending[name] = text
+        self._schedule()
+    
+    def _schedule(self):
+        """Apply pending values on the next frame."""
+        if not self._scheduled:
+            self._scheduled = True
+            Clock.schedule_once(self._flush, 0)
+    
+    def _flush(self, dt):
+        """Write pending values to their labels, skipping unchanged text."""
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for name, text in pending.items():
+            label = getattr(self, name)
+            if label.text != text:
+                label.text = text
+
+
+class FileChooserRow(ModernButton):
+    """
+    Single entry of a FastFileChooser.
+    """
+    path = StringProperty('')
+    is_dir = BooleanProperty(False)
+    
+    def __init__(self, **kwargs):
+        super(FileChooserRow, self).__init__(**kwargs)
+        
+        # Left-align names within the row
+        self.halign = 'left'
+        self.shorten = True
+        self.fbind('size', self.update_text_size)
+    
+    def update_text_size(self, *args):
+        """Update text size when size changes."""
+        self.text_size = self.width - 20, None
+    
+    def on_release(self):
+        """Open directories and select files in the owning chooser."""
+        chooser = self.parent.parent if self.parent else None
+        if chooser is not None:
+            chooser.open_entry(self.path, self.is_dir)
+
+
+class FastFileChooser(RecycleView):
+    """
+    Lightweight file chooser backed by os.scandir.
+    Only the rows currently visible are turned into widgets.
+    """
+    path = StringProperty('')
+    selection = ListProperty([])
+    
+    ROW_COLOR = (0.2, 0.2, 0.2, 1)
+    SELECTED_COLOR = (0.2, 0.4, 0.7, 1)
+    
+    def __init__(self, filters=None, **kwargs):
+        # Glob-style filters such as '*.txt'; only the extension part is used
+        self.extensions = tuple(f.lstrip('*').lower() for f in (filters or []))
+        
+        super(FastFileChooser, self).__init__(**kwargs)
+        
+        self.viewclass = FileChooserRow
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, 36),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=2
+        )
+        layout.fbind('minimum_height', layout.setter('height'))
+        self.add_widget(layout)
+        
+        # Rescan whenever the directory changes
+        self.fbind('path', self.refresh)
+        self.fbind('selection', self.update_selection)
+        self.refresh()
+    
+    def refresh(self, *args):
+        """Rescan the current directory."""
+        dirs = []
+        files = []
+        if self.path:
+            try:
+                with os.scandir(self.path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        try:
+                            if entry.is_dir():
+                                dirs.append(entry)
+                            elif not self.extensions or entry.name.lower().endswith(self.extensions):
+                                files.append(entry)
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+        
+        dirs.sort(key=lambda e: e.name.lower())
+        files.sort(key=lambda e: e.name.lower())
+        
+        rows = [{'text': '..', 'path': os.path.dirname(os.path.abspath(self.path or '.')), 'is_dir': True}]
+        rows.extend({'text': e.name + os.sep, 'path': e.path, 'is_dir': True} for e in dirs)
+        rows.extend({'text': e.name, 'path': e.path, 'is_dir': False} for e in files)
+        for row in rows:
+            row['background_color'] = self.ROW_COLOR
+        
+        self.data = rows
+        self.selection = []
+    
+    def open_entry(self, path, is_dir):
+        """Enter a directory or select a file."""
+        if is_dir:
+            self.path = path
+        else:
+            self.selection = [path]
+    
+    def update_selection(self, *args):
+        """Highlight the selected file."""
+        selected = set(self.selection)
+        for row in self.data:
+            row['background_color'] = self.SELECTED_COLOR if row['path'] in selected else self.ROW_COLOR
+        self.refresh_from_data()